@@ -1,708 +1,2576 @@
 import os
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
 import threading
-import subprocess
-import winreg
-import ctypes
+import time
+from array import array
 from pathlib import Path
-import csv
 from datetime import datetime
+# subprocess, ctypes, winreg, csv and json are imported where first needed to keep startup fast.
+# tkinter is imported by main() only when the GUI starts, so the daemon and CLI run without Tk.
+tk = ttk = messagebox = None
 
-class ProjectScoutApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Project Scout - Find Your Projects")
-        self.root.geometry("1200x600")
-
-        self.projects = []
-        self.scanning = False
-        self.stop_requested = False
+# Scan snapshots are stored per user so consecutive runs can be compared
+APP_DATA_DIR = os.path.join(str(Path.home()), ".project_scout")
+SNAPSHOT_DIR = os.path.join(APP_DATA_DIR, "snapshots")
+SNAPSHOT_VERSION = 2  # Version 1 snapshots were JSON files, they can still be loaded
+SNAPSHOT_COLUMNS = ("name", "path", "type", "git", "status", "created", "modified")
+MAX_SNAPSHOTS = 30
+SNAPSHOT_DISPLAY_BATCH = 200  # Rows of the last scan added to the list per event loop turn
 
-        self.found_paths = set()
-        self.status_update_counter = 0  # Counter for throttling status updates
-        self.projects_added_count = 0  # Counter for GUI refresh
-        self.setup_ui()
-        self.current_theme = self.get_system_theme()
-        self.apply_theme(self.current_theme)
+# Binary snapshot layout (little-endian, sections aligned to 8 bytes):
+#   header        magic, version, column count, row count, taken (epoch seconds), heap offset, heap size
+#   column table  per column: name, kind, dictionary size, data offset, dictionary offset
+#   columns       STRING: u32[rows + 1] heap offsets, DICTIONARY: u8[rows] codes,
+#                 DATE: i64[rows] minutes since 1970-01-01 local time (minimum = Unknown)
+#   dictionaries  u32[size + 1] heap offsets of the distinct values of a DICTIONARY column
+#   heap          UTF-8 strings
+SNAPSHOT_MAGIC = b"PSCOUTSS"
+SNAPSHOT_HEADER = "<8sHHIqQQ"
+SNAPSHOT_COLUMN_ENTRY = "<16sBxxxIQQ"
+STRING_COLUMN, DICTIONARY_COLUMN, DATE_COLUMN = 0, 1, 2
+SNAPSHOT_COLUMN_KINDS = {"name": STRING_COLUMN, "path": STRING_COLUMN, "type": DICTIONARY_COLUMN,
+                         "git": DICTIONARY_COLUMN, "status": DICTIONARY_COLUMN,
+                         "created": DATE_COLUMN, "modified": DATE_COLUMN}
+UNKNOWN_DATE, EMPTY_DATE = -2 ** 63, -2 ** 63 + 1  # Below any real date, also pre-1970 ones
 
-    def setup_ui(self):
-        # Top Controls
-        control_frame = ttk.Frame(self.root, padding="10")
-        control_frame.pack(fill=tk.X)
 
-        self.status_label = ttk.Label(control_frame, text="Click 'Start Scan' to begin searching...")
-        self.status_label.pack(side=tk.LEFT, padx=5)
+def encode_date(text):
+    """'YYYY-MM-DD HH:MM' -> minutes since 1970 (naive local time, so it round-trips exactly)"""
+    if text == "Unknown":
+        return UNKNOWN_DATE
+    import calendar
+    try:
+        return calendar.timegm((int(text[0:4]), int(text[5:7]), int(text[8:10]),
+                                int(text[11:13]), int(text[14:16]), 0)) // 60
+    except ValueError:
+        return EMPTY_DATE
 
-        self.scan_btn = ttk.Button(control_frame, text="Start Scan", command=self.toggle_scan)
-        self.scan_btn.pack(side=tk.RIGHT, padx=5)
 
-        self.theme_btn = ttk.Button(control_frame, text="☾", width=3, command=self.toggle_theme)
-        self.theme_btn.pack(side=tk.RIGHT, padx=5)
+def decode_date(minutes):
+    if minutes == UNKNOWN_DATE:
+        return "Unknown"
+    if minutes == EMPTY_DATE:
+        return ""
+    return time.strftime("%Y-%m-%d %H:%M", time.gmtime(minutes * 60))
 
-        # Treeview for Projects
-        columns = ("name", "path", "type", "git", "status", "created", "modified")
-        self.tree = ttk.Treeview(self.root, columns=columns, show="headings")
-        self.tree.heading("name", text="Project Name", command=lambda: self.sort_by_column("name"))
-        self.tree.heading("path", text="Directory Path", command=lambda: self.sort_by_column("path"))
-        self.tree.heading("type", text="Type", command=lambda: self.sort_by_column("type"))
-        self.tree.heading("git", text="Git", command=lambda: self.sort_by_column("git"))
-        self.tree.heading("status", text="Git Status", command=lambda: self.sort_by_column("status"))
-        self.tree.heading("created", text="Created", command=lambda: self.sort_by_column("created"))
-        self.tree.heading("modified", text="Modified", command=lambda: self.sort_by_column("modified"))
 
-        self.tree.column("name", width=120)
-        self.tree.column("path", width=350)
-        self.tree.column("type", width=100)
-        self.tree.column("git", width=50)
-        self.tree.column("status", width=80)
-        self.tree.column("created", width=120)
-        self.tree.column("modified", width=120)
-        
-        self.sort_reverse = {}  # Track sort direction for each column
+def save_snapshot(rows):
+    """Save scan results as a new binary snapshot, return its file path"""
+    import struct
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    taken = datetime.now()
+    rows = list(rows)
 
-        self.tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+    heap = bytearray()
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(self.tree, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    def heap_offsets(values):
+        offsets = []
+        for value in values:
+            offsets.append(len(heap))
+            heap.extend(value.encode("utf-8", "surrogateescape"))
+        offsets.append(len(heap))
+        return struct.pack(f"<{len(offsets)}I", *offsets)
 
-        # Bottom Buttons
-        bottom_frame = ttk.Frame(self.root, padding="10")
-        bottom_frame.pack(fill=tk.X)
+    base = struct.calcsize(SNAPSHOT_HEADER) + len(SNAPSHOT_COLUMNS) * struct.calcsize(SNAPSHOT_COLUMN_ENTRY)
+    body = bytearray()
 
-        ttk.Button(bottom_frame, text="Run Project", command=self.run_project).pack(side=tk.LEFT, padx=5)
-        ttk.Button(bottom_frame, text="Open in Explorer", command=self.open_in_explorer).pack(side=tk.LEFT, padx=5)
-        ttk.Button(bottom_frame, text="Open with Antigravity", command=self.open_with_antigravity).pack(side=tk.LEFT, padx=5)
-        ttk.Button(bottom_frame, text="Export to CSV", command=self.export_to_csv).pack(side=tk.LEFT, padx=5)
-        
-        # Color tags
-        self.tree.tag_configure("git_yes", background="#e1f5fe") # Light blue for git projects
-        self.tree.tag_configure("dirty", foreground="#d32f2f")   # Red text for uncommitted changes
+    def place(data):
+        body.extend(b"\0" * (-(base + len(body)) % 8))
+        offset = base + len(body)
+        body.extend(data)
+        return offset
 
-    def get_system_theme(self):
-        try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
-            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-            winreg.CloseKey(key)
-            return "Light" if value == 1 else "Dark"
-        except Exception:
-            return "Light"
+    table = bytearray()
+    for i, column in enumerate(SNAPSHOT_COLUMNS):
+        values = [row[i] for row in rows]
+        kind = SNAPSHOT_COLUMN_KINDS[column]
+        size, dictionary_offset = 0, 0
+        if kind == STRING_COLUMN:
+            data_offset = place(heap_offsets(values))
+        elif kind == DICTIONARY_COLUMN:
+            dictionary = sorted(set(values))
+            if len(dictionary) > 256:
+                raise ValueError(f"Too many distinct values in column {column}")
+            codes = {value: code for code, value in enumerate(dictionary)}
+            data_offset = place(bytes(codes[value] for value in values))
+            size, dictionary_offset = len(dictionary), place(heap_offsets(dictionary))
+        else:
+            data_offset = place(struct.pack(f"<{len(values)}q", *(encode_date(v) for v in values)))
+        table.extend(struct.pack(SNAPSHOT_COLUMN_ENTRY, column.encode("ascii"), kind, size,
+                                 data_offset, dictionary_offset))
+    heap_offset = place(heap)
+    header = struct.pack(SNAPSHOT_HEADER, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(SNAPSHOT_COLUMNS),
+                         len(rows), int(taken.timestamp()), heap_offset, len(heap))
 
-    def toggle_theme(self):
-        new_theme = "Dark" if self.current_theme == "Light" else "Light"
-        self.apply_theme(new_theme)
+    # Write to a temp file first so readers never see a half-written snapshot
+    temp_file = os.path.join(SNAPSHOT_DIR, f"snapshot-{os.getpid()}-{threading.get_ident()}.tmp")
+    with open(temp_file, 'wb') as f:
+        f.write(header + table + body)
 
-    def apply_theme(self, theme):
-        self.current_theme = theme
-        style = ttk.Style(self.root)
-        style.theme_use("clam")
-        
-        if theme == "Dark":
-            bg = "#2b2b2b"
-            fg = "#ffffff"
-            field_bg = "#383838"
-            
-            self.root.configure(bg=bg)
-            style.configure(".", background=bg, foreground=fg, fieldbackground=field_bg)
-            style.configure("Treeview", background="#383838", foreground=fg, fieldbackground="#383838")
-            style.configure("Treeview.Heading", background="#404040", foreground=fg, relief="flat")
-            style.map("Treeview", background=[("selected", "#005a9e")])
-            
-            style.configure("TButton", background="#404040", foreground=fg, bordercolor="#505050")
-            style.map("TButton", background=[("active", "#505050")])
-            
-            # Update tags for Dark Mode
-            self.tree.tag_configure("git_yes", background="#1e3a50")
-            self.tree.tag_configure("dirty", foreground="#ff6b6b")
-            
-            if hasattr(self, 'theme_btn'):
-                self.theme_btn.config(text="☀")
-                
-            # Windows Title Bar Dark
+    # Publish under a unique name: the GUI and the daemon may both save within the
+    # same second. os.link is atomic and fails if the name is taken; on a clash the
+    # name moves on by a microsecond, so names still sort in save order.
+    from datetime import timedelta
+    try:
+        for attempt in range(100):
+            stamp = (taken + timedelta(microseconds=attempt)).strftime('%Y%m%d-%H%M%S-%f')
+            filename = os.path.join(SNAPSHOT_DIR, f"snapshot-{stamp}.pss")
             try:
-                # DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-                hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
-                value = ctypes.c_int(1)
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, 20, ctypes.byref(value), ctypes.sizeof(value))
-            except:
-                pass
-                
+                os.link(temp_file, filename)
+                break
+            except FileExistsError:
+                continue
+            except OSError:
+                # Filesystem without hard links
+                if os.path.exists(filename):
+                    continue
+                os.replace(temp_file, filename)
+                break
         else:
-            bg = "#f0f0f0"
-            fg = "#000000"
-            
-            self.root.configure(bg=bg)
-            style.configure(".", background=bg, foreground=fg)
-            style.configure("Treeview", background="white", foreground="black", fieldbackground="white")
-            style.configure("Treeview.Heading", background="#f0f0f0", foreground="black")
-            style.map("Treeview", background=[("selected", "#0078d7")])
-            
-            style.configure("TButton", background="#e1e1e1", foreground="black")
-            style.map("TButton", background=[("active", "#e5f1fb")])
-            
-            # Update tags for Light Mode
-            self.tree.tag_configure("git_yes", background="#e1f5fe")
-            self.tree.tag_configure("dirty", foreground="#d32f2f")
-            
-            if hasattr(self, 'theme_btn'):
-                self.theme_btn.config(text="☾")
-                
-            # Windows Title Bar Light
-            try:
-                hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
-                value = ctypes.c_int(0)
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, 20, ctypes.byref(value), ctypes.sizeof(value))
-            except:
-                pass
+            raise OSError(f"Could not create a unique snapshot file in {SNAPSHOT_DIR}")
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
 
-    def toggle_scan(self):
-        if self.scanning:
-            self.stop_requested = True
-            self.status_label.config(text="Stopping scan...")
-        else:
-            self.start_scan()
+    # Keep only the newest MAX_SNAPSHOTS
+    for old in list_snapshots()[:-MAX_SNAPSHOTS]:
+        try:
+            os.remove(old)
+        except OSError:
+            pass  # Still mapped by another process on Windows, removed next time
+    return filename
 
-    def start_scan(self):
-        self.projects = []
-        self.found_paths = set()
-        self.status_update_counter = 0  # Reset counter
-        self.projects_added_count = 0  # Reset projects counter
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        
-        self.scanning = True
-        self.stop_requested = False
-        self.scan_btn.config(text="Stop Scan")
-        
-        # Start scanning in a background thread
-        thread = threading.Thread(target=self.run_scanner, daemon=True)
-        thread.start()
 
-    def is_network_drive(self, path):
-        """Check if path is on a network drive"""
+class SnapshotReader:
+    """Rows of a binary snapshot, read lazily from a memory-mapped file.
+
+    Opening reads only the header and the column table, so it takes the same
+    time for any number of projects; a row is decoded when it is accessed.
+    The mapping is read-only and shared between all processes reading the file.
+    """
+
+    def __init__(self, filename):
+        import mmap
+        import struct
+        with open(filename, 'rb') as f:
+            try:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Empty snapshot file: {filename}")
         try:
-            if os.name == 'nt':  # Windows
-                import ctypes
-                drive_type = ctypes.windll.kernel32.GetDriveTypeW(path)
-                # DRIVE_REMOTE = 4
-                return drive_type == 4
-        except:
-            pass
-        return False
+            self.read_layout(filename)
+        except (struct.error, IndexError, UnicodeDecodeError, OverflowError, OSError):
+            raise ValueError(f"Corrupt snapshot file: {filename}")
 
-    def run_scanner(self):
-        # Search priorities: Home first, then D:, then others (skip network drives and C: initially)
-        # get_available_drives() already filters out network drives, so we can use them directly
-        home = str(Path.home())
-        drives = sorted(self.get_available_drives())
-        
-        # Start with home folder and D: drive
-        search_paths = [home]
-        
-        # Add D: drive second if it exists
-        if "D:\\" in drives:
-            search_paths.append("D:\\")
-        
-        # Add other local drives (skip C: for now)
-        for d in drives:
-            if d not in search_paths and d != "C:\\":
-                search_paths.append(d)
-        
-        # Add C: drive last (to avoid system folders that slow things down)
-        if "C:\\" in drives:
-            search_paths.append("C:\\")
+    def read_layout(self, filename):
+        """Parse the header and column table and check every section lies inside the file"""
+        import struct
+        magic, version, column_count, self.row_count, taken, self.heap_offset, self.heap_size = struct.unpack_from(
+            SNAPSHOT_HEADER, self.data, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        if self.heap_offset + self.heap_size != len(self.data):
+            raise ValueError(f"Truncated snapshot file: {filename}")
+        self.taken = datetime.fromtimestamp(taken).strftime("%Y-%m-%d %H:%M:%S")
 
-        excluded_folders = {
-            "windows", "program files", "program files (x86)", 
-            "programdata", "recovery", "system volume information",
-            "node_modules", "venv", ".venv", "__pycache__", ".git",
-            "appdata", "local", "roaming", "microsoft", "cache"
-            , "pictures", "music", "videos", "desktop", "links", ".cursor",
-            "favorites", "contacts", "searches", "saved games", "objects",
-            "$recycle.bin", "recycle.bin", "exception", "user data",
-            # WordPress/CMS folders that generate false positives
-            "uploads", "plugins", "themes", "wp-content", "wp-includes", "wp-admin",
-            "vendor", "assets", "libs", "lib", "libraries", "documentation",
-            # Build folders
-            "dist", "build", "target", "out", "bin", "obj"
-        }
-        
-        # Portable browser name patterns (case insensitive check will be done)
-        self.portable_browser_patterns = {
-            "firefox", "chrome", "opera", "edge", "brave", "vivaldi",
-            "tor browser", "waterfox", "pale moon", "librewolf"
-        }
-        
-        system_excludes = {
-            "c:\\windows", "c:\\program files", "c:\\program files (x86)",
-            "c:\\programdata", "c:\\recovery", "c:\\system volume information",
-            "c:\\$recycle.bin", "d:\\$recycle.bin"
-        }
+        self.string_span = struct.Struct("<II")
+        self.int64 = struct.Struct("<q")
+        columns = {}
+        entry_size = struct.calcsize(SNAPSHOT_COLUMN_ENTRY)
+        for i in range(column_count):
+            name, kind, size, data_offset, dictionary_offset = struct.unpack_from(
+                SNAPSHOT_COLUMN_ENTRY, self.data, struct.calcsize(SNAPSHOT_HEADER) + i * entry_size)
+            if kind == STRING_COLUMN:
+                self.check_offsets(data_offset, self.row_count)
+            elif kind == DICTIONARY_COLUMN:
+                self.check_section(data_offset, self.row_count)
+                self.check_offsets(dictionary_offset, size)
+            elif kind == DATE_COLUMN:
+                self.check_section(data_offset, 8 * self.row_count)
+            else:
+                raise ValueError(f"Unknown column kind {kind} in snapshot file: {filename}")
+            columns[name.rstrip(b"\0").decode("ascii")] = (kind, size, data_offset, dictionary_offset)
+        # Stored columns are mapped onto the current column order, missing ones read as ""
+        self.columns = [columns.get(column) for column in SNAPSHOT_COLUMNS]
+        self.dictionaries = [[self.string(column[3], code) for code in range(column[1])]
+                             if column and column[0] == DICTIONARY_COLUMN else None
+                             for column in self.columns]
 
-        for base_path in search_paths:
-            if self.stop_requested: break
-            if base_path.lower() in system_excludes: continue
-            self.update_status(f"Scanning {base_path}...")
-            self.scan_directory(base_path, excluded_folders, depth=0)
+    def check_section(self, offset, length):
+        if offset + length > self.heap_offset:
+            raise IndexError("snapshot section outside of file")
 
-        self.scanning = False
-        self.root.after(0, lambda: self.scan_btn.config(text="Start Scan"))
-        self.update_status("Scan complete.")
+    def check_offsets(self, offset, count):
+        """A heap offset array must fit before the heap and end inside it (offsets only grow)"""
+        self.check_section(offset, 4 * (count + 1))
+        if self.string_span.unpack_from(self.data, offset + 4 * count)[0] > self.heap_size:
+            raise IndexError("snapshot string outside of heap")
 
-    def get_available_drives(self):
-        """Get available local drives, skipping network drives"""
-        import string
-        from ctypes import windll
-        drives = []
-        bitmask = windll.kernel32.GetLogicalDrives()
-        kernel32 = windll.kernel32
-        
-        for letter in string.ascii_uppercase:
-            if bitmask & 1:
-                path = f"{letter}:\\"
-                # Check drive type before checking if it exists
-                # This avoids hanging on network drives
-                try:
-                    drive_type = kernel32.GetDriveTypeW(path)
-                    # DRIVE_UNKNOWN = 0, DRIVE_NO_ROOT_DIR = 1, DRIVE_REMOVEABLE = 2
-                    # DRIVE_FIXED = 3, DRIVE_REMOTE = 4, DRIVE_CDROM = 5, DRIVE_RAMDISK = 6
-                    # Only include fixed (local) drives (3), skip network (4) and others
-                    if drive_type == 3:  # DRIVE_FIXED - local hard drive
-                        # Quick check if path exists (should be fast for local drives)
-                        try:
-                            if os.path.exists(path):
-                                drives.append(path)
-                        except (OSError, PermissionError):
-                            pass  # Skip if can't access
-                    # Skip all other drive types (network, CD-ROM, removable, etc.)
-                except Exception:
-                    pass  # Skip if GetDriveTypeW fails
-            bitmask >>= 1
-        return drives
+    def string(self, offsets, i):
+        start, end = self.string_span.unpack_from(self.data, offsets + 4 * i)
+        if not start <= end <= self.heap_size:
+            raise IndexError("snapshot string outside of heap")
+        return self.data[self.heap_offset + start:self.heap_offset + end].decode("utf-8", "surrogateescape")
 
-    def get_directory_dates(self, path):
-        """Get creation and modification dates of directory"""
-        try:
-            stat = os.stat(path)
-            created = datetime.fromtimestamp(stat.st_ctime).strftime("%Y-%m-%d %H:%M")
-            modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-            return created, modified
-        except Exception:
-            return "Unknown", "Unknown"
+    def value(self, column_index, i):
+        column = self.columns[column_index]
+        if column is None:
+            return ""
+        kind, _, data_offset, _ = column
+        if kind == STRING_COLUMN:
+            return self.string(data_offset, i)
+        if kind == DICTIONARY_COLUMN:
+            return self.dictionaries[column_index][self.data[data_offset + i]]
+        return decode_date(self.int64.unpack_from(self.data, data_offset + 8 * i)[0])
 
-    def check_git_status(self, path):
+    def __len__(self):
+        return self.row_count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.row_count
+        if not 0 <= i < self.row_count:
+            raise IndexError("snapshot row index out of range")
         try:
-            # git status --porcelain returns empty if clean, and lists files if dirty
-            # Use timeout and faster flags to prevent hanging
-            result = subprocess.run(
-                ["git", "status", "--porcelain", "--ignore-submodules=dirty"],
-                cwd=path,
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=2,  # 2 second timeout to prevent hanging
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-            )
-            if result.returncode != 0:
-                return "Unknown"
-            
-            return "Dirty" if result.stdout.strip() else "Clean"
-        except subprocess.TimeoutExpired:
-            return "Timeout"
-        except Exception:
-            return "Error"
+            return tuple(self.value(c, i) for c in range(len(SNAPSHOT_COLUMNS)))
+        except (IndexError, UnicodeDecodeError, OverflowError, OSError):
+            raise ValueError(f"Corrupt snapshot file: row {i} cannot be decoded")
 
-    def is_portable_browser_folder(self, folder_name):
-        """Check if folder name indicates a portable browser"""
+    def __iter__(self):
+        return (self[i] for i in range(self.row_count))
+
+
+def list_snapshots():
+    """Return snapshot file paths, oldest first"""
+    try:
+        names = os.listdir(SNAPSHOT_DIR)
+    except OSError:
+        return []
+    return [os.path.join(SNAPSHOT_DIR, n) for n in sorted(names)
+            if n.startswith("snapshot-") and n.endswith((".pss", ".json"))]
+
+
+def snapshot_label(filename):
+    """'snapshot-20240101-120000-123456.pss' -> '20240101-120000-123456'"""
+    return os.path.splitext(os.path.basename(filename))[0][len("snapshot-"):]
+
+
+def load_snapshot(filename):
+    """Open a snapshot file, returns dict with 'taken' and 'rows' (a sequence of row tuples)"""
+    if filename.endswith(".pss"):
+        reader = SnapshotReader(filename)
+        return {"version": SNAPSHOT_VERSION, "taken": reader.taken, "rows": reader}
+
+    import json
+    with open(filename, 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    if snapshot.get("version") != 1:
+        raise ValueError(f"Unsupported snapshot version: {snapshot.get('version')}")
+    # Map stored columns onto the current column order
+    columns = snapshot.get("columns", list(SNAPSHOT_COLUMNS))
+    order = [columns.index(c) if c in columns else None for c in SNAPSHOT_COLUMNS]
+    snapshot["rows"] = [tuple(row[i] if i is not None else "" for i in order) for row in snapshot["rows"]]
+    return snapshot
+
+
+def diff_snapshots(old, new):
+    """Compare two snapshots.
+
+    Rows are joined on the normcased path through a hash index, so the diff
+    is linear in the number of projects. Returns a dict of change kind ->
+    list of (before_row, after_row); before_row is None for added projects
+    and after_row is None for removed ones.
+    """
+    path_col = SNAPSHOT_COLUMNS.index("path")
+    type_col = SNAPSHOT_COLUMNS.index("type")
+    status_col = SNAPSHOT_COLUMNS.index("status")
+    modified_col = SNAPSHOT_COLUMNS.index("modified")
+
+    def index_rows(rows):
+        return {os.path.normcase(row[path_col]): row for row in rows}
+
+    old_rows = index_rows(old["rows"])
+    new_rows = index_rows(new["rows"])
+
+    diff = {"added": [], "removed": [], "type": [], "status": [], "activity": []}
+    for path, row in new_rows.items():
+        before = old_rows.get(path)
+        if before is None:
+            diff["added"].append((None, row))
+            continue
+        if before[type_col] != row[type_col]:
+            diff["type"].append((before, row))
+        if {before[status_col], row[status_col]} == {"Clean", "Dirty"}:
+            diff["status"].append((before, row))
+        if before[modified_col] != row[modified_col]:
+            diff["activity"].append((before, row))
+    for path, row in old_rows.items():
+        if path not in new_rows:
+            diff["removed"].append((row, None))
+    return diff
+
+
+def describe_change(kind, before, after):
+    """Return (label, row, detail) describing one diff entry for display"""
+    if kind == "added":
+        return "New", after, after[SNAPSHOT_COLUMNS.index("type")]
+    if kind == "removed":
+        return "Removed", before, before[SNAPSHOT_COLUMNS.index("type")]
+    column = {"type": "type", "status": "status", "activity": "modified"}[kind]
+    i = SNAPSHOT_COLUMNS.index(column)
+    label = {"type": "Type Changed", "status": "Git Status", "activity": "Activity"}[kind]
+    return label, after, f"{before[i]} -> {after[i]}"
+
+
+def resolve_snapshot(spec):
+    """Resolve a snapshot given as file path, list index (-1 = latest) or name (prefix of the label)"""
+    import re
+    if os.path.isfile(spec):
+        return spec
+    snapshots = list_snapshots()
+    # Only short numbers are indexes, longer digit strings are dates like 20240101
+    if re.fullmatch(r"[+-]?\d{1,3}", spec):
+        try:
+            return snapshots[int(spec)]
+        except IndexError:
+            raise ValueError(f"No snapshot at index {spec}")
+    for filename in snapshots:
+        if snapshot_label(filename).startswith(spec) or os.path.basename(filename).startswith(spec):
+            return filename
+    raise ValueError(f"Snapshot not found: {spec}")
+
+
+def print_snapshot_diff(specs):
+    """CLI: print what changed between two snapshots (default: the last two)"""
+    specs = list(specs) or ["-2", "-1"]
+    if len(specs) == 1:
+        specs.append("-1")
+    try:
+        old_file, new_file = resolve_snapshot(specs[0]), resolve_snapshot(specs[1])
+        old, new = load_snapshot(old_file), load_snapshot(new_file)
+        diff = diff_snapshots(old, new)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    print(f"Changes from {old['taken']} to {new['taken']}:")
+    for kind, entries in diff.items():
+        for before, after in entries:
+            label, row, detail = describe_change(kind, before, after)
+            print(f"  {label:<13} {row[0]:<30} {detail:<25} {row[1]}")
+    counts = ", ".join(f"{len(entries)} {kind}" for kind, entries in diff.items())
+    print(f"Summary: {counts}")
+    return 0
+
+
+# Manifest metadata is cached against file mtime/size between runs
+MANIFEST_CACHE_FILE = os.path.join(APP_DATA_DIR, "manifest_cache.json")
+MANIFEST_CACHE_VERSION = 1
+MAX_MANIFEST_SIZE = 512 * 1024  # Bigger manifests are generated files, not worth parsing
+MANIFEST_FILES = {"package.json", "pyproject.toml", "cargo.toml", "go.mod", "pubspec.yaml", "composer.json"}
+
+# Dependency name -> framework, checked in order, first match wins
+FRAMEWORK_DEPENDENCIES = {
+    "package.json": [("next", "Next.js"), ("nuxt", "Vue.js"), ("@angular/core", "Angular"),
+                     ("@sveltejs/kit", "Svelte"), ("svelte", "Svelte"), ("vue", "Vue.js"),
+                     ("react", "React"), ("react-scripts", "React"), ("vite", "Vite")],
+    "pyproject.toml": [("django", "Django"), ("fastapi", "FastAPI"), ("flask", "Flask")],
+    "cargo.toml": [("tauri", "Tauri"), ("actix-web", "Actix"), ("axum", "Axum"),
+                   ("rocket", "Rocket"), ("bevy", "Bevy")],
+    "go.mod": [("github.com/gin-gonic/gin", "Gin"), ("github.com/labstack/echo/v4", "Echo"),
+               ("github.com/gofiber/fiber/v2", "Fiber")],
+    "pubspec.yaml": [("flutter", "Flutter")],
+    "composer.json": [("laravel/framework", "Laravel"), ("symfony/framework-bundle", "Symfony")],
+}
+
+
+def detect_framework(manifest, dependencies):
+    """Return framework name for a manifest's dependency list, or empty string"""
+    names = set(dependencies)
+    for dependency, framework in FRAMEWORK_DEPENDENCIES.get(manifest, []):
+        if dependency in names:
+            return framework
+    return ""
+
+
+def load_toml(text):
+    """Parse TOML with tomllib (Python 3.11+) or tomli, None if neither is available"""
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            return None
+    return tomllib.loads(text)
+
+
+def requirement_name(requirement):
+    """Package name from a PEP 508 requirement string ('Django>=4.2' -> 'django')"""
+    import re
+    match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)
+    return match.group(1).lower().replace("_", "-") if match else ""
+
+
+def parse_package_json(text):
+    import json
+    pkg = json.loads(text)
+    dependencies = list(pkg.get("dependencies", {})) + list(pkg.get("devDependencies", {}))
+    return {
+        "dependencies": dependencies,
+        "scripts": dict(pkg.get("scripts", {})),
+        "language_version": (pkg.get("engines") or {}).get("node", ""),
+    }
+
+
+def parse_composer_json(text):
+    import json
+    pkg = json.loads(text)
+    require = dict(pkg.get("require", {}))
+    php_version = require.pop("php", "")
+    dependencies = list(require) + list(pkg.get("require-dev", {}))
+    scripts = {name: cmd if isinstance(cmd, str) else " && ".join(cmd)
+               for name, cmd in pkg.get("scripts", {}).items()}
+    return {"dependencies": dependencies, "scripts": scripts, "language_version": php_version}
+
+
+def parse_pyproject(text):
+    data = load_toml(text)
+    if data is None:
+        return {"dependencies": [], "scripts": {}, "language_version": ""}
+    project = data.get("project", {})
+    poetry = data.get("tool", {}).get("poetry", {})
+    dependencies = [requirement_name(r) for r in project.get("dependencies", [])]
+    poetry_deps = dict(poetry.get("dependencies", {}))
+    python_version = project.get("requires-python", "") or str(poetry_deps.pop("python", ""))
+    dependencies += [name.lower() for name in poetry_deps]
+    scripts = dict(project.get("scripts", {}))
+    scripts.update(poetry.get("scripts", {}))
+    return {"dependencies": [d for d in dependencies if d], "scripts": scripts,
+            "language_version": python_version}
+
+
+def parse_cargo_toml(text):
+    data = load_toml(text)
+    if data is None:
+        return {"dependencies": [], "scripts": {}, "language_version": ""}
+    dependencies = list(data.get("dependencies", {})) + list(data.get("dev-dependencies", {}))
+    dependencies += list(data.get("workspace", {}).get("dependencies", {}))
+    package = data.get("package", {})
+    return {"dependencies": dependencies, "scripts": {},
+            "language_version": str(package.get("rust-version", "") or package.get("edition", ""))}
+
+
+def parse_go_mod(text):
+    dependencies = []
+    go_version = ""
+    in_require = False
+    for line in text.splitlines():
+        line = line.split("//")[0].strip()
+        if not line:
+            continue
+        if in_require:
+            if line == ")":
+                in_require = False
+            else:
+                dependencies.append(line.split()[0])
+        elif line.startswith("go "):
+            go_version = line[3:].strip()
+        elif line == "require (":
+            in_require = True
+        elif line.startswith("require "):
+            dependencies.append(line.split()[1])
+    return {"dependencies": dependencies, "scripts": {}, "language_version": go_version}
+
+
+def parse_pubspec(text):
+    """Line based reader for the parts of pubspec.yaml we need (no yaml dependency)"""
+    dependencies = []
+    sdk_version = ""
+    section = None
+    section_indent = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip())
+        key, _, value = stripped.partition(":")
+        if indent == 0:
+            section, section_indent = key, None
+            continue
+        if section_indent is None:
+            section_indent = indent
+        if indent != section_indent:
+            continue
+        if section in ("dependencies", "dev_dependencies"):
+            dependencies.append(key)
+        elif section == "environment" and key == "sdk":
+            sdk_version = value.strip().strip("'\"")
+    return {"dependencies": dependencies, "scripts": {}, "language_version": sdk_version}
+
+
+def parse_csproj(text):
+    import xml.etree.ElementTree as ET
+    root = ET.fromstring(text)
+    dependencies = []
+    target = ""
+    for element in root.iter():
+        tag = element.tag.split("}")[-1]  # Old-style projects use the msbuild namespace
+        if tag == "PackageReference" and element.get("Include"):
+            dependencies.append(element.get("Include"))
+        elif tag in ("TargetFramework", "TargetFrameworks", "TargetFrameworkVersion") and not target:
+            target = (element.text or "").strip()
+    framework = ""
+    sdk = root.get("Sdk", "")
+    if sdk == "Microsoft.NET.Sdk.Web":
+        framework = "ASP.NET Core"
+    elif sdk == "Microsoft.NET.Sdk.BlazorWebAssembly":
+        framework = "Blazor"
+    elif any(d.startswith("Avalonia") for d in dependencies):
+        framework = "Avalonia"
+    return {"dependencies": dependencies, "scripts": {}, "language_version": target, "framework": framework}
+
+
+MANIFEST_PARSERS = {
+    "package.json": parse_package_json,
+    "composer.json": parse_composer_json,
+    "pyproject.toml": parse_pyproject,
+    "cargo.toml": parse_cargo_toml,
+    "go.mod": parse_go_mod,
+    "pubspec.yaml": parse_pubspec,
+}
+
+
+def parse_manifest(filename):
+    """Parse a manifest into {dependencies, scripts, framework, language_version}.
+    Returns None for unknown, oversized or unreadable manifests."""
+    manifest = os.path.basename(filename).lower()
+    parser = parse_csproj if manifest.endswith(".csproj") else MANIFEST_PARSERS.get(manifest)
+    if parser is None:
+        return None
+    try:
+        if os.path.getsize(filename) > MAX_MANIFEST_SIZE:
+            return None
+        with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+            data = parser(f.read())
+    except Exception:
+        return None  # Broken manifests are common in the wild, just skip them
+    if not data.get("framework"):
+        data["framework"] = detect_framework(manifest, data["dependencies"])
+    return data
+
+
+class ManifestCache:
+    """Parsed manifests keyed by file path, valid while the file's mtime and size are unchanged"""
+
+    def __init__(self, filename=MANIFEST_CACHE_FILE):
+        self.filename = filename
+        self.entries = None  # Loaded on first use
+        self.touched = set()
+        self.lock = threading.Lock()
+
+    def load(self):
+        import json
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            entries = cache["entries"] if cache.get("version") == MANIFEST_CACHE_VERSION else {}
+        except (OSError, ValueError, KeyError):
+            entries = {}
+        self.entries = entries
+
+    def get(self, filename):
+        """Parsed manifest data for filename, parsing it only if it changed"""
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            self.touched.add(filename)
+            cached = self.entries.get(filename)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        data = parse_manifest(filename)
+        with self.lock:
+            self.entries[filename] = [stat.st_mtime_ns, stat.st_size, data]
+        return data
+
+    def save(self, prune=False):
+        """Write the cache to disk. prune drops manifests not seen since startup."""
+        import json
+        with self.lock:
+            if self.entries is None:
+                return
+            if prune:
+                self.entries = {k: v for k, v in self.entries.items() if k in self.touched}
+            cache = {"version": MANIFEST_CACHE_VERSION, "entries": self.entries}
+            try:
+                os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+                with open(self.filename + ".tmp", 'w', encoding='utf-8') as f:
+                    json.dump(cache, f, separators=(",", ":"))
+                os.replace(self.filename + ".tmp", self.filename)
+            except OSError:
+                pass
+
+
+# Folder counts and durations of previous scans, used for progress estimates
+SCAN_HISTORY_FILE = os.path.join(APP_DATA_DIR, "scan_history.json")
+SCAN_HISTORY_VERSION = 1
+PROGRESS_INTERVAL_MS = 250  # Status label refresh rate while scanning
+
+# Learned pruning: big subtrees that never contained a project are skipped,
+# and revisited on a cadence that doubles with every barren visit
+PRUNE_MIN_DIRS = 200  # Smaller subtrees are cheap enough to always scan
+PRUNE_MAX_DEPTH = 6
+PRUNE_AFTER_BARREN_SCANS = 3
+PRUNE_REVISIT_DAYS = 7
+PRUNE_MAX_REVISIT_DAYS = 90
+
+
+def load_scan_history():
+    import json
+    try:
+        with open(SCAN_HISTORY_FILE, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+        if history.get("version") == SCAN_HISTORY_VERSION:
+            return history
+    except (OSError, ValueError):
+        pass
+    return {"version": SCAN_HISTORY_VERSION, "roots": {}, "subtrees": {}}
+
+
+def save_scan_history(history):
+    import json
+    try:
+        os.makedirs(APP_DATA_DIR, exist_ok=True)
+        with open(SCAN_HISTORY_FILE + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(history, f, separators=(",", ":"))
+        os.replace(SCAN_HISTORY_FILE + ".tmp", SCAN_HISTORY_FILE)
+    except OSError:
+        pass
+
+
+def format_duration(seconds):
+    """Short human readable duration: 45s, 3m 20s, 1h 05m"""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+
+
+# Linux root discovery (see select_mount_roots)
+MOUNTINFO_FILE = "/proc/self/mountinfo"
+NETWORK_FILESYSTEMS = {
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "ncpfs", "afs", "ceph", "glusterfs",
+    "lustre", "9p", "davfs", "sshfs", "fuse.sshfs", "fuse.rclone", "fuse.s3fs",
+}
+PSEUDO_FILESYSTEMS = {
+    "proc", "sysfs", "tmpfs", "devtmpfs", "devpts", "cgroup", "cgroup2", "overlay",
+    "squashfs", "securityfs", "debugfs", "tracefs", "mqueue", "hugetlbfs", "pstore",
+    "bpf", "autofs", "configfs", "fusectl", "binfmt_misc", "efivarfs", "nsfs",
+    "ramfs", "rpc_pipefs", "selinuxfs", "nfsd", "iso9660",
+}
+# FUSE filesystems are treated as remote unless known to be local disks
+LOCAL_FUSE_FILESYSTEMS = {"fuseblk", "fuse.ntfs-3g", "fuse.exfat", "fuse.mergerfs"}
+LINUX_SYSTEM_DIRS = {
+    "/proc", "/sys", "/dev", "/run", "/boot", "/usr", "/lib", "/lib32", "/lib64",
+    "/libx32", "/bin", "/sbin", "/etc", "/var", "/snap", "/tmp", "/lost+found",
+}
+# Mount point prefixes ordered by how likely they hold projects; "/" goes last
+MOUNT_PRIORITY = ["/home", "/srv", "/workspace", "/projects", "/data", "/opt", "/mnt", "/media"]
+
+
+def read_mountinfo(filename=MOUNTINFO_FILE):
+    """Parse the mount table into dicts with device, root, mount_point and fstype"""
+    import re
+
+    def unescape(field):
+        # Spaces, tabs etc. are written as octal escapes (\040)
+        return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), field)
+
+    mounts = []
+    with open(filename, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            # id parent major:minor root mount_point options [optional...] - fstype source super_options
+            fields = line.split()
+            try:
+                sep = fields.index("-", 6)
+            except ValueError:
+                continue
+            if len(fields) < sep + 2:
+                continue
+            mounts.append({
+                "device": fields[2],
+                "root": unescape(fields[3]),
+                "mount_point": unescape(fields[4]),
+                "fstype": fields[sep + 1],
+            })
+    return mounts
+
+
+def is_remote_filesystem(fstype):
+    if fstype in NETWORK_FILESYSTEMS:
+        return True
+    return fstype.startswith("fuse") and fstype not in LOCAL_FUSE_FILESYSTEMS
+
+
+def select_mount_roots(mounts):
+    """Pick scan roots from the mount table.
+
+    Skips remote, FUSE and pseudo filesystems, mounts inside system folders
+    and bind-mount duplicates (a device whose mounted root lies inside an
+    already selected mount of the same device). Returns (roots ordered by
+    likely project density, mount points the scan must not enter).
+    """
+    def under(path, parent):
+        return path == parent or path.startswith(parent.rstrip("/") + "/")
+
+    roots = []
+    skip_paths = set()
+    selected = {}  # device -> mounted roots (paths inside the filesystem)
+    # Full mounts (root "/") before bind mounts of subfolders
+    for mount in sorted(mounts, key=lambda m: len(m["root"])):
+        mount_point, fstype = mount["mount_point"], mount["fstype"]
+        if is_remote_filesystem(fstype) or fstype in PSEUDO_FILESYSTEMS:
+            skip_paths.add(mount_point)
+            continue
+        if any(under(mount_point, d) for d in LINUX_SYSTEM_DIRS):
+            continue
+        device_roots = selected.setdefault(mount["device"], [])
+        if any(under(mount["root"], r) for r in device_roots):
+            skip_paths.add(mount_point)  # Same files are reachable through the other mount
+            continue
+        device_roots.append(mount["root"])
+        roots.append(mount_point)
+
+    def priority(mount_point):
+        if mount_point == "/":
+            return len(MOUNT_PRIORITY) + 1
+        for i, prefix in enumerate(MOUNT_PRIORITY):
+            if under(mount_point, prefix):
+                return i
+        return len(MOUNT_PRIORITY)
+
+    roots.sort(key=lambda m: (priority(m), m))
+    return roots, skip_paths
+
+
+class ScanProgress:
+    """Percent complete, scan rate and ETA from per-root folder count estimates.
+
+    The scanner thread only bumps counters; the GUI reads them on a timer.
+    """
+
+    def __init__(self, estimates):
+        self.estimates = dict(estimates)  # root -> expected folder count
+        self.counts = {root: 0 for root in estimates}
+        self.seconds = {}  # root -> scan duration, for finished roots
+        self.current_root = None
+        self.root_started = None
+        self.started = time.monotonic()
+        self.dirs_scanned = 0
+
+    def start_root(self, root):
+        self.current_root = root
+        self.root_started = time.monotonic()
+
+    def finish_root(self):
+        root = self.current_root
+        self.estimates[root] = self.counts[root]  # Exact from now on
+        self.seconds[root] = time.monotonic() - self.root_started
+        self.current_root = None
+
+    def count_dir(self):
+        self.dirs_scanned += 1
+        self.counts[self.current_root] += 1
+
+    def expected_total(self):
+        expected = 0
+        for root, estimate in self.estimates.items():
+            count = self.counts[root]
+            # A root that outgrows its estimate is assumed to be almost done
+            expected += max(estimate, count * 1.05) if root == self.current_root else max(estimate, count)
+        return expected
+
+    def percent(self):
+        expected = self.expected_total()
+        return min(99.9, 100.0 * self.dirs_scanned / expected) if expected else 0.0
+
+    def rate(self):
+        """Folders per second since the scan started"""
+        elapsed = time.monotonic() - self.started
+        return self.dirs_scanned / elapsed if elapsed > 0 else 0.0
+
+    def eta(self):
+        """Estimated seconds remaining, None while the rate is unknown"""
+        rate = self.rate()
+        if rate <= 0:
+            return None
+        return max(0.0, self.expected_total() - self.dirs_scanned) / rate
+
+
+class PathTable:
+    """Interned paths stored as (parent id, name segment id) pairs.
+
+    Every distinct path gets a small integer id and every distinct folder name
+    is stored once, so memory grows with the number of distinct segments
+    rather than total path length. Full strings are rebuilt only on demand.
+    """
+
+    def __init__(self):
+        self.parents = array('i')  # path id -> parent path id (-1 for roots)
+        self.segments = array('i')  # path id -> segment id
+        self.segment_names = []  # segment id -> name
+        self.segment_ids = {}  # name -> segment id
+        self.children = {}  # (parent id << 32 | segment id) -> path id
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.parents)
+
+    def intern(self, path):
+        """Return the id of path, adding it and its parents if needed"""
+        with self.lock:
+            path_id = -1
+            for part in Path(path).parts:
+                segment_id = self.segment_ids.get(part)
+                if segment_id is None:
+                    segment_id = self.segment_ids[part] = len(self.segment_names)
+                    self.segment_names.append(part)
+                key = (path_id << 32) | segment_id
+                child_id = self.children.get(key)
+                if child_id is None:
+                    child_id = self.children[key] = len(self.parents)
+                    self.parents.append(path_id)
+                    self.segments.append(segment_id)
+                path_id = child_id
+            return path_id
+
+    def lookup(self, path):
+        """Return the id of path, or None if it was never interned"""
+        path_id = -1
+        for part in Path(path).parts:
+            segment_id = self.segment_ids.get(part)
+            if segment_id is None:
+                return None
+            path_id = self.children.get((path_id << 32) | segment_id)
+            if path_id is None:
+                return None
+        return path_id if path_id >= 0 else None
+
+    def name(self, path_id):
+        """Last segment of the path (folder name)"""
+        return self.segment_names[self.segments[path_id]]
+
+    def path(self, path_id):
+        """Build the full path string for display"""
+        parts = []
+        while path_id >= 0:
+            parts.append(self.segment_names[self.segments[path_id]])
+            path_id = self.parents[path_id]
+        return os.path.join(*reversed(parts))
+
+
+def normalize_remote_url(url):
+    """Canonical form of a git remote URL, so different spellings of one repository match.
+    'git@github.com:User/repo.git' and 'https://github.com/user/repo/' -> 'github.com/user/repo'"""
+    import re
+    url = url.strip()
+    if re.match(r"^[A-Za-z]:[\\/]", url) or url.startswith(("/", "\\")):
+        url = os.path.normcase(os.path.normpath(url))  # Local path remote
+    elif "://" in url:
+        url = url.split("://", 1)[1]
+        host, _, rest = url.partition("/")
+        url = host.rsplit("@", 1)[-1] + "/" + rest  # Drop credentials
+    elif ":" in url:
+        host, _, rest = url.partition(":")  # scp-like syntax: user@host:path
+        url = host.rsplit("@", 1)[-1] + "/" + rest.lstrip("/")
+    url = url.rstrip("/\\")
+    if url.endswith(".git"):
+        url = url[:-4]
+    return url.lower()
+
+
+def read_remote_url(config_file):
+    """URL of the 'origin' remote (or the first remote) from a git config file"""
+    import re
+    remotes = {}
+    section = None
+    try:
+        with open(config_file, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    match = re.match(r'\[remote\s+"(.+)"\]', line)
+                    section = match.group(1) if match else None
+                elif section and "=" in line:
+                    key, value = line.split("=", 1)
+                    if key.strip().lower() == "url" and value.strip():
+                        remotes.setdefault(section, value.strip())
+    except OSError:
+        return None
+    return remotes.get("origin") or next(iter(remotes.values()), None)
+
+
+def folder_size(path):
+    """Total size of files under path in bytes (links are not followed)"""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def print_duplicate_report():
+    """CLI: list repositories cloned more than once in the last scan, with their sizes"""
+    snapshots = list_snapshots()
+    if not snapshots:
+        print("Error: No saved scan found, run a scan first")
+        return 1
+    try:
+        snapshot = load_snapshot(snapshots[-1])
+        git_paths = [row[1] for row in snapshot["rows"] if row[3] == "Yes"]
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    scanner = ProjectScanner()
+    for path in git_paths:
+        scanner.index_repository(path)
+    groups = scanner.duplicate_groups()
+    if not groups:
+        print("No duplicate clones found.")
+        return 0
+
+    total_redundant = 0
+    for identity, paths in groups:
+        sizes = [folder_size(path) for path in paths]
+        redundant = sum(sizes) - max(sizes)
+        total_redundant += redundant
+        print(f"{identity} - {len(paths)} clones, {format_size(redundant)} redundant")
+        for path, size in zip(paths, sizes):
+            print(f"  {format_size(size):>10}  {path}")
+    redundant_clones = sum(len(paths) - 1 for _, paths in groups)
+    print(f"Summary: {redundant_clones} redundant clones using {format_size(total_redundant)}")
+    return 0
+
+
+class ProjectScanner:
+    """Finds projects on local drives.
+
+    Has no GUI dependencies: results and status messages are reported through
+    the on_project and on_status callbacks, which are called from the scanning
+    thread. Used by ProjectScoutApp and by the headless index daemon.
+    """
+
+    def __init__(self, on_project=None, on_status=None, follow_links=False, full_scan=False):
+        self.on_project = on_project or (lambda values: None)
+        self.on_status = on_status or (lambda text: None)
+        # Symlinks and junctions are skipped unless follow_links is set;
+        # followed links and mounts are walked once per physical folder (visited_dirs)
+        self.follow_links = follow_links
+        self.full_scan = full_scan  # Ignore learned pruning and scan every subtree
+        self.manifest_cache = ManifestCache()
+        self.metadata_pool = None  # Parses manifests in parallel while scanning
+        self.reset()
+
+    def reset(self):
+        """Forget previous results before a new scan"""
+        self.projects = []  # Result records, paths stored as PathTable ids
+        self.path_table = PathTable()
+        self.found_ids = set()
+        self.visited_dirs = set()  # Identities (st_dev, st_ino) of walked roots, mount points and, with follow_links, folders
+        self.mount_points = set()  # Mount points from the mount table (Linux)
+        self.prune_history = {}  # Barren subtree path -> stats from previous scans
+        self.subtree_stats = {}  # Subtree path -> (folders, projects) in this scan
+        self.pruned = []  # Subtrees skipped in this scan
+        self.skip_paths = set()  # Normcased paths never entered (remote/pseudo mounts, system folders, walked roots)
+        self.repo_groups = {}  # Repository identity -> path ids of its clones, in discovery order
+        self.repo_of = {}  # Path id -> repository identity
+        self.project_metadata = {}  # Project path id -> merged manifest metadata
+        self.projects_added_count = 0
+        self.progress = None  # ScanProgress of the running scan
+        self.current_scan_path = ""
+        self.stop_requested = False
+
+    def is_network_drive(self, path):
+        """Check if path is on a network drive"""
+        try:
+            if os.name == 'nt':  # Windows
+                import ctypes
+                drive_type = ctypes.windll.kernel32.GetDriveTypeW(path)
+                # DRIVE_REMOTE = 4
+                return drive_type == 4
+        except:
+            pass
+        return False
+
+    def run(self):
+        """Scan all roots, returns True if the scan completed (was not stopped)"""
+        home = str(Path.home())
+        if os.name == 'nt':
+            # Search priorities: Home first, then D:, then others (skip network drives and C: initially)
+            # get_available_drives() already filters out network drives, so we can use them directly
+            drives = sorted(self.get_available_drives())
+            
+            # Start with home folder and D: drive
+            search_paths = [home]
+            
+            # Add D: drive second if it exists
+            if "D:\\" in drives:
+                search_paths.append("D:\\")
+            
+            # Add other local drives (skip C: for now)
+            for d in drives:
+                if d not in search_paths and d != "C:\\":
+                    search_paths.append(d)
+            
+            # Add C: drive last (to avoid system folders that slow things down)
+            if "C:\\" in drives:
+                search_paths.append("C:\\")
+        else:
+            # Local mounts from the mount table, home first; remote and pseudo
+            # filesystems and bind-mount duplicates are never entered
+            roots, self.skip_paths, self.mount_points = self.get_mount_roots()
+            search_paths = [home] + [r for r in roots if r != home]
+
+        excluded_folders = {
+            "windows", "program files", "program files (x86)", 
+            "programdata", "recovery", "system volume information",
+            "node_modules", "venv", ".venv", "__pycache__", ".git",
+            "appdata", "local", "roaming", "microsoft", "cache"
+            , "pictures", "music", "videos", "desktop", "links", ".cursor",
+            "favorites", "contacts", "searches", "saved games", "objects",
+            "$recycle.bin", "recycle.bin", "exception", "user data",
+            # WordPress/CMS folders that generate false positives
+            "uploads", "plugins", "themes", "wp-content", "wp-includes", "wp-admin",
+            "vendor", "assets", "libs", "lib", "libraries", "documentation",
+            # Build folders
+            "dist", "build", "target", "out", "bin", "obj"
+        }
+        
+        # Portable browser name patterns (case insensitive check will be done)
+        self.portable_browser_patterns = {
+            "firefox", "chrome", "opera", "edge", "brave", "vivaldi",
+            "tor browser", "waterfox", "pale moon", "librewolf"
+        }
+        
+        system_excludes = {
+            "c:\\windows", "c:\\program files", "c:\\program files (x86)",
+            "c:\\programdata", "c:\\recovery", "c:\\system volume information",
+            "c:\\$recycle.bin", "d:\\$recycle.bin"
+        }
+
+        search_paths = [p for p in search_paths if p.lower() not in system_excludes]
+        # Each root is walked on its own, so it is skipped where it appears inside
+        # another root (home inside C:\ or /, mounts inside /): nothing is walked twice
+        self.skip_paths.update(os.path.normcase(p) for p in search_paths)
+        history = load_scan_history()
+        self.prune_history = history.setdefault("subtrees", {})
+        self.progress = ScanProgress(self.estimate_root_sizes(search_paths, excluded_folders, history))
+
+        from concurrent.futures import ThreadPoolExecutor
+        self.metadata_pool = ThreadPoolExecutor(max_workers=4)
+        try:
+            for base_path in search_paths:
+                if self.stop_requested: break
+                self.progress.start_root(base_path)
+                self.scan_directory(base_path, excluded_folders, depth=0)
+                if not self.stop_requested:
+                    self.progress.finish_root()
+        finally:
+            # Let queued manifest parsing finish, then persist the cache
+            self.metadata_pool.shutdown(wait=True)
+            self.metadata_pool = None
+            self.manifest_cache.save(prune=not self.stop_requested)
+
+        if self.stop_requested:
+            self.on_status("Scan stopped.")
+            return False
+
+        for root_path, count in self.progress.counts.items():
+            history["roots"][root_path] = {"dirs": count, "seconds": round(self.progress.seconds[root_path], 1)}
+        skipped = sum(self.prune_history[p]["dirs"] for p in self.pruned)
+        self.update_prune_history(history["subtrees"])
+        save_scan_history(history)
+        elapsed = format_duration(time.monotonic() - self.progress.started)
+
+        # Only complete scans are saved, a partial one would show up as removed projects
+        summary = ""
+        try:
+            previous = list_snapshots()
+            new_file = save_snapshot(self.project_rows())
+        except (OSError, ValueError):
+            previous, new_file = [], None
+            summary = " (Could not save snapshot)"
+        if previous:
+            try:
+                diff = diff_snapshots(load_snapshot(previous[-1]), load_snapshot(new_file))
+                summary = (f" {len(diff['added'])} new, {len(diff['removed'])} removed, "
+                           f"{len(diff['status'])} status changes since last scan.")
+            except (OSError, ValueError):
+                summary = " (Could not compare with the previous scan)"
+        redundant_clones = sum(len(paths) - 1 for _, paths in self.duplicate_groups())
+        if redundant_clones:
+            summary += f" {redundant_clones} duplicate clones."
+        if self.pruned:
+            summary += f" Skipped {len(self.pruned)} folders that never had projects (~{skipped} subfolders, use Full scan to include them)."
+        self.on_status(f"Scan complete in {elapsed} ({self.progress.dirs_scanned} folders)." + summary)
+        return True
+
+    def should_prune(self, path):
+        """Skip a subtree that was barren in several scans, unless it is due for a revisit"""
+        if self.full_scan:
+            return False
+        stats = self.prune_history.get(path)
+        if not stats or stats["barren"] < PRUNE_AFTER_BARREN_SCANS:
+            return False
+        extra_visits = stats["barren"] - PRUNE_AFTER_BARREN_SCANS
+        revisit_days = min(PRUNE_MAX_REVISIT_DAYS, PRUNE_REVISIT_DAYS * 2 ** extra_visits)
+        return time.time() - stats["last_visit"] < revisit_days * 86400
+
+    def update_prune_history(self, subtrees):
+        """Fold this scan's subtree yields into the history (only for complete scans)"""
+        now = round(time.time())
+        barren = {path for path, (dirs, projects) in self.subtree_stats.items() if projects == 0}
+        for path, (dirs, projects) in self.subtree_stats.items():
+            # Only the topmost barren folder is remembered, its subfolders are implied
+            if projects or os.path.dirname(path) in barren:
+                subtrees.pop(path, None)
+                continue
+            streak = subtrees.get(path, {}).get("barren", 0) + 1
+            subtrees[path] = {"dirs": dirs, "barren": streak, "last_visit": now}
+
+    def estimate_root_sizes(self, roots, excluded_folders, history):
+        """Expected folder count per root: the previous scan's count blended with a fresh sample"""
+        estimates = {}
+        for root_path in roots:
+            if self.stop_requested:
+                break
+            sampled = self.sample_directory_count(root_path, excluded_folders)
+            previous = history["roots"].get(root_path, {}).get("dirs")
+            # Samples are noisy, last scan's exact count is the better signal when we have it
+            estimates[root_path] = sampled if previous is None else 0.75 * previous + 0.25 * sampled
+        for root_path in roots:
+            estimates.setdefault(root_path, 0)
+        return estimates
+
+    def sample_directory_count(self, root_path, excluded_folders, probes=16, max_depth=24):
+        """Estimate how many folders a scan of root_path visits.
+
+        Knuth's random-probe estimator: walk random paths down the tree, each
+        walk estimates the size as 1 + b1 + b1*b2 + ... where bN is the number
+        of scannable subfolders at level N. Costs about probes * depth listings.
+        """
+        import random
+        total = 0.0
+        for _ in range(probes):
+            estimate, width, current = 1.0, 1.0, root_path
+            for _ in range(max_depth):
+                children = self.list_scannable_dirs(current, excluded_folders)
+                if not children:
+                    break
+                width *= len(children)
+                estimate += width
+                current = random.choice(children)
+            total += estimate
+        return total / probes
+
+    def list_scannable_dirs(self, path, excluded_folders):
+        """Subfolders scan_directory would descend into (none for git repos)"""
+        dirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.lower() == ".git":
+                        return []
+                    # Same skips as scan_directory, so sampling never enters remote/pseudo mounts
+                    if self.is_skipped(entry.path) or self.should_prune(entry.path):
+                        continue
+                    try:
+                        if entry.is_dir() and self.should_descend(entry, excluded_folders):
+                            dirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return dirs
+
+    def is_skipped(self, path):
+        return os.path.normcase(path) in self.skip_paths
+
+    def should_descend(self, entry, excluded_folders):
+        """Whether the scan walks into a subfolder entry.
+        Hidden, excluded and portable browser folders are skipped, and links unless follow_links is set."""
+        name = entry.name
+        if name.startswith(".") or name.lower() in excluded_folders or self.is_portable_browser_folder(name):
+            return False
+        return self.follow_links or not self.is_link(entry)
+
+    def is_link(self, entry):
+        """Symlink, or junction on Windows (entry.is_dir() follows both)"""
+        if entry.is_symlink():
+            return True
+        if os.name == 'nt':
+            try:
+                # IO_REPARSE_TAG_MOUNT_POINT; other reparse points like OneDrive folders are real folders
+                return entry.stat(follow_symlinks=False).st_reparse_tag == 0xA0000003
+            except (OSError, AttributeError):
+                return False
+        return False
+
+    def directory_identity(self, path):
+        """Physical identity of a folder as (st_dev, st_ino), None if unknown.
+        A tuple, not a packed int: Windows reports 128-bit file IDs on ReFS."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not st.st_ino:
+            return None  # Filesystem without file IDs (e.g. FAT on Windows)
+        return st.st_dev, st.st_ino
+
+    def get_available_drives(self):
+        """Get available local drives, skipping network drives"""
+        import string
+        from ctypes import windll
+        drives = []
+        bitmask = windll.kernel32.GetLogicalDrives()
+        kernel32 = windll.kernel32
+        
+        for letter in string.ascii_uppercase:
+            if bitmask & 1:
+                path = f"{letter}:\\"
+                # Check drive type before checking if it exists
+                # This avoids hanging on network drives
+                try:
+                    drive_type = kernel32.GetDriveTypeW(path)
+                    # DRIVE_UNKNOWN = 0, DRIVE_NO_ROOT_DIR = 1, DRIVE_REMOVEABLE = 2
+                    # DRIVE_FIXED = 3, DRIVE_REMOTE = 4, DRIVE_CDROM = 5, DRIVE_RAMDISK = 6
+                    # Only include fixed (local) drives (3), skip network (4) and others
+                    if drive_type == 3:  # DRIVE_FIXED - local hard drive
+                        # Quick check if path exists (should be fast for local drives)
+                        try:
+                            if os.path.exists(path):
+                                drives.append(path)
+                        except (OSError, PermissionError):
+                            pass  # Skip if can't access
+                    # Skip all other drive types (network, CD-ROM, removable, etc.)
+                except Exception:
+                    pass  # Skip if GetDriveTypeW fails
+            bitmask >>= 1
+        return drives
+
+    def get_mount_roots(self):
+        """Linux equivalent of get_available_drives: (roots to scan, mount points to skip, all mount points)"""
+        try:
+            mounts = read_mountinfo()
+        except OSError:
+            return [], set(LINUX_SYSTEM_DIRS), set()  # No /proc (e.g. macOS): scan home only
+        roots, skip_paths = select_mount_roots(mounts)
+        return roots, skip_paths | LINUX_SYSTEM_DIRS, {m["mount_point"] for m in mounts}
+
+    def get_directory_dates(self, path):
+        """Get creation and modification dates of directory"""
+        try:
+            stat = os.stat(path)
+            created = datetime.fromtimestamp(stat.st_ctime).strftime("%Y-%m-%d %H:%M")
+            modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
+            return created, modified
+        except Exception:
+            return "Unknown", "Unknown"
+
+    def check_git_status(self, path):
+        import subprocess
+        try:
+            # git status --porcelain returns empty if clean, and lists files if dirty
+            # Use timeout and faster flags to prevent hanging
+            result = subprocess.run(
+                ["git", "status", "--porcelain", "--ignore-submodules=dirty"],
+                cwd=path,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=2,  # 2 second timeout to prevent hanging
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            )
+            if result.returncode != 0:
+                return "Unknown"
+            
+            return "Dirty" if result.stdout.strip() else "Clean"
+        except subprocess.TimeoutExpired:
+            return "Timeout"
+        except Exception:
+            return "Error"
+
+    def is_portable_browser_folder(self, folder_name):
+        """Check if folder name indicates a portable browser"""
+        folder_lower = folder_name.lower()
+        # Check if folder contains "portable" and any browser name
+        if "portable" in folder_lower:
+            for browser in self.portable_browser_patterns:
+                if browser in folder_lower:
+                    return True
+        return False
+
+    def is_subfolder_of_project(self, path):
+        """Recursively check parent directories to see if this is part of a larger project"""
+        # Max levels to check up
+        max_levels = 8
+        current = path
+        
+        # Don't check the path itself, start with parent
+        parent = os.path.dirname(path)
+        
+        for _ in range(max_levels):
+            if parent == current: # Reached root drive
+                break
+                
+            # Check for project markers in this parent directory
+            try:
+                # Indicators that suggest the parent is the REAL project root
+                indicators = [
+                    ".git", "package.json", "composer.json", "pubspec.yaml",
+                    "go.mod", "Cargo.toml", "pom.xml", "manage.py", "requirements.txt",
+                    "mix.exs", "build.sbt", ".gitignore", "Makefile",
+                    "webpack.config.js", "rollup.config.js"
+                ]
+                
+                # Check for WordPress Theme (style.css + functions.php)
+                if os.path.exists(os.path.join(parent, "style.css")) and \
+                   os.path.exists(os.path.join(parent, "functions.php")):
+                    return True
+                
+                # Check for standard indicators
+                for indicator in indicators:
+                    if os.path.exists(os.path.join(parent, indicator)):
+                        return True
+                        
+                # Check if parent has a "src" directory (strong indicator of project root)
+                if os.path.exists(os.path.join(parent, "src")) and os.path.isdir(os.path.join(parent, "src")):
+                    return True
+
+                # Check for Visual Studio Solution in parent
+                if any(f.endswith(".sln") for f in os.listdir(parent)):
+                    return True
+
+                # Check if parent matches "folder/folder.php" (WP Plugin) pattern
+                parent_name = os.path.basename(parent).lower()
+                clean_name = parent_name.replace("-master", "").replace("-main", "")
+                
+                # Check for exact match or cleaned match
+                if os.path.exists(os.path.join(parent, f"{parent_name}.php")) or \
+                   os.path.exists(os.path.join(parent, f"{clean_name}.php")):
+                    return True
+                        
+            except (PermissionError, OSError):
+                pass
+            
+            # Move up
+            current = parent
+            parent = os.path.dirname(current)
+            
+        return False
+
+    def resolve_git_dir(self, path):
+        """Return the git directory of the repo at path (follows 'gitdir:' files)"""
+        dot_git = os.path.join(path, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git
+        try:
+            with open(dot_git, 'r', encoding='utf-8', errors='ignore') as f:
+                line = f.readline().strip()
+            if line.startswith("gitdir:"):
+                git_dir = line[len("gitdir:"):].strip()
+                if not os.path.isabs(git_dir):
+                    git_dir = os.path.join(path, git_dir)
+                return os.path.normpath(git_dir)
+        except (OSError, UnicodeDecodeError):
+            pass
+        return None
+
+    def repo_identity(self, path):
+        """Identity shared by all clones of a repository, read from .git without running git.
+
+        'remote:<normalized url>' from the origin remote, or for repos without
+        remotes 'objects:<path>' when the object store is borrowed from another
+        repo (clone --shared/--reference). None for unknown repos and for linked
+        worktrees, which are checkouts of one repo rather than separate clones.
+        """
+        git_dir = self.resolve_git_dir(path)
+        if not git_dir or os.path.exists(os.path.join(git_dir, "commondir")):
+            return None
+        url = read_remote_url(os.path.join(git_dir, "config"))
+        if url:
+            return "remote:" + normalize_remote_url(url)
+        try:
+            with open(os.path.join(git_dir, "objects", "info", "alternates"), 'r', encoding='utf-8') as f:
+                alternate = f.readline().strip()
+            if alternate:
+                return "objects:" + os.path.normcase(os.path.realpath(os.path.join(git_dir, "objects", alternate)))
+        except OSError:
+            pass
+        return None
+
+    def index_repository(self, path):
+        """Add a git project to the clone index (constant time lookup per repository)"""
+        path_id = self.path_table.intern(path)
+        if path_id in self.repo_of:
+            return
+        identity = self.repo_identity(path)
+        if identity:
+            self.repo_of[path_id] = identity
+            self.repo_groups.setdefault(identity, []).append(path_id)
+
+    def duplicate_of(self, path):
+        """Path of the first found clone if path is another clone of it, else None"""
+        path_id = self.path_table.lookup(path)
+        identity = self.repo_of.get(path_id)
+        if identity is None:
+            return None
+        first = self.repo_groups[identity][0]
+        return None if first == path_id else self.path_table.path(first)
+
+    def duplicate_groups(self):
+        """[(identity, [paths])] for repositories with more than one clone"""
+        return [(identity.split(":", 1)[1], [self.path_table.path(i) for i in path_ids])
+                for identity, path_ids in self.repo_groups.items() if len(path_ids) > 1]
+
+    def read_submodule_paths(self, path):
+        """Read submodule paths declared in .gitmodules"""
+        paths = []
+        try:
+            with open(os.path.join(path, ".gitmodules"), 'r', encoding='utf-8', errors='ignore') as f:
+                for line in f:
+                    key, sep, value = line.strip().partition("=")
+                    if sep and key.strip().lower() == "path" and value.strip():
+                        paths.append(os.path.join(path, os.path.normpath(value.strip().strip('"'))))
+        except OSError:
+            pass
+        return paths
+
+    def read_worktree_paths(self, path):
+        """Read linked worktree locations registered in .git/worktrees"""
+        paths = []
+        git_dir = self.resolve_git_dir(path)
+        if not git_dir:
+            return paths
+        worktrees_dir = os.path.join(git_dir, "worktrees")
+        try:
+            names = os.listdir(worktrees_dir)
+        except OSError:
+            return paths
+        for name in names:
+            try:
+                # <git_dir>/worktrees/<name>/gitdir holds the path to <worktree>/.git
+                with open(os.path.join(worktrees_dir, name, "gitdir"), 'r', encoding='utf-8', errors='ignore') as f:
+                    target = f.readline().strip()
+                if target:
+                    paths.append(os.path.dirname(os.path.normpath(target)))
+            except OSError:
+                continue
+        return paths
+
+    def search_nested_git_dirs(self, path, excluded_folders, max_depth=3):
+        """Breadth-first search for folders containing .git, at most max_depth levels deep.
+        Does not descend into repositories it finds - those are scanned on their own."""
+        found = []
+        frontier = [path]
+        for _ in range(max_depth):
+            next_frontier = []
+            for current in frontier:
+                if self.stop_requested:
+                    return found
+                try:
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            try:
+                                if not entry.is_dir():
+                                    continue
+                            except OSError:
+                                continue
+                            if not self.should_descend(entry, excluded_folders):
+                                continue
+                            if os.path.exists(os.path.join(entry.path, ".git")):
+                                found.append(entry.path)
+                            else:
+                                next_frontier.append(entry.path)
+                except OSError:
+                    continue
+            frontier = next_frontier
+        return found
+
+    def find_nested_repositories(self, path, excluded_folders):
+        """Find git repositories nested inside the repo at path.
+
+        Consults .gitmodules and .git/worktrees first, then a bounded search
+        for .git entries, so the repo's working tree is never walked in full.
+        """
+        root_key = os.path.normcase(os.path.normpath(path))
+        prefix = root_key if root_key.endswith(os.sep) else root_key + os.sep
+
+        candidates = self.read_submodule_paths(path) + self.read_worktree_paths(path)
+        candidates += self.search_nested_git_dirs(path, excluded_folders)
+
+        nested = []
+        seen = set()
+        for candidate in candidates:
+            candidate = os.path.normpath(candidate)
+            key = os.path.normcase(candidate)
+            # Only repositories inside this working tree (worktrees may live elsewhere)
+            if key in seen or not key.startswith(prefix):
+                continue
+            seen.add(key)
+            if os.path.exists(os.path.join(candidate, ".git")):
+                nested.append(candidate)
+        return nested
+
+    def is_vendor_or_library_folder(self, path, folder_name):
+        """Check if folder is likely a vendor/library folder, not a real project"""
         folder_lower = folder_name.lower()
-        # Check if folder contains "portable" and any browser name
-        if "portable" in folder_lower:
-            for browser in self.portable_browser_patterns:
-                if browser in folder_lower:
-                    return True
+        path_lower = path.lower()
+        
+        # Common vendor/library folder patterns
+        vendor_patterns = [
+            "vendor", "vendors", "third-party", "thirdparty", "external",
+            "packages", "libs", "libraries", "dependencies",
+            "bower_components", "jspm_packages",
+            "mode", "modes",  # CodeMirror modes
+            "addons", "add-ons", "plugins", "extensions", "modules"
+        ]
+        
+        # Check if folder name matches vendor patterns
+        if any(pattern in folder_lower for pattern in vendor_patterns):
+            return True
+        
+        # Check if path contains WordPress/CMS indicators
+        cms_indicators = [
+            "wp-content", "wordpress", "joomla", "drupal", "elementor",
+            "essential-addons", "epic-news", "eventful", "astra"
+        ]
+        if any(indicator in path_lower for indicator in cms_indicators):
+            return True
+        
+        # Check if it's a documentation folder with only index.html
+        if "documentation" in folder_lower or "docs" == folder_lower:
+            return True
+            
         return False
 
-    def is_subfolder_of_project(self, path):
-        """Recursively check parent directories to see if this is part of a larger project"""
-        # Max levels to check up
-        max_levels = 8
-        current = path
-        
-        # Don't check the path itself, start with parent
-        parent = os.path.dirname(path)
-        
-        for _ in range(max_levels):
-            if parent == current: # Reached root drive
+    def has_substantial_project_files(self, path, files_in_dir, project_type):
+        """Check if folder has substantial project files, not just one index.html"""
+        
+        # For HTML projects, require more than just index.html
+        if project_type == "Web/HTML":
+            # Check if there are other meaningful files
+            html_files = [f for f in files_in_dir if f.endswith(".html")]
+            js_files = [f for f in files_in_dir if f.endswith(".js")]
+            css_files = [f for f in files_in_dir if f.endswith(".css")]
+            
+            # If only index.html exists with no other meaningful files, skip it
+            if len(html_files) == 1 and len(js_files) == 0 and len(css_files) == 0:
+                return False
+                
+            # Check for common non-project patterns
+            folder_name = os.path.basename(path).lower()
+            non_project_names = [
+                "mode", "modes", "theme", "addon", "plugin", "extension",
+                "help", "about", "documentation", "demo", "example", "sample"
+            ]
+            if any(name in folder_name for name in non_project_names):
+                return False
+        
+        return True
+
+    def scan_directory(self, path, excluded_folders, depth=0):
+        """Scan path and its subfolders, returns (folders visited, projects found)"""
+        if depth and self.is_skipped(path):
+            return 0, 0
+        if depth and self.should_prune(path):
+            self.pruned.append(path)
+            return 0, 0
+
+        # Walk every physical folder once. Nested roots are skipped by path (run), so
+        # without followed links only a mount can lead into a folder a second time:
+        # identities are kept for roots and mount points only. A followed link can
+        # point at any folder, so then every folder is recorded.
+        if self.follow_links or not depth or path in self.mount_points:
+            identity = self.directory_identity(path)
+            if identity is not None:
+                if identity in self.visited_dirs:
+                    return 0, 0
+                self.visited_dirs.add(identity)
+
+        # Progress is only counted here, the GUI timer (refresh_progress) displays it
+        self.current_scan_path = path
+        if self.progress:
+            self.progress.count_dir()
+
+        try:
+            entries = list(os.scandir(path))
+        except PermissionError:
+            return 1, 0
+        except Exception:
+            return 1, 0
+
+        is_project = False
+        project_type = ""
+        has_git = False
+
+        files_in_dir = []
+        dirs_in_dir = []
+        manifest_names = []  # Real-case names of manifests for the extraction stage
+        
+        for entry in entries:
+            try:
+                name_lower = entry.name.lower()
+                if name_lower == ".git":
+                    # .git is a folder in regular repos and a file in submodules/worktrees
+                    has_git = True
+                elif entry.is_file():
+                    files_in_dir.append(name_lower)
+                    if name_lower in MANIFEST_FILES or name_lower.endswith(".csproj"):
+                        manifest_names.append(entry.name)
+                elif entry.is_dir():
+                    if self.should_descend(entry, excluded_folders):
+                        dirs_in_dir.append(entry.name)
+            except (PermissionError, OSError):
+                continue
+        del entries  # Don't keep DirEntry objects alive while recursing
+
+        # Identification Logic
+        if "package.json" in files_in_dir:
+            is_project = True
+            # Check for specific frameworks
+            if any(f in ["vite.config.js", "vite.config.ts"] for f in files_in_dir):
+                project_type = "Vite"
+            elif any(f in ["vue.config.js", "nuxt.config.js"] for f in files_in_dir):
+                project_type = "Vue.js"
+            elif any(f in ["angular.json"] for f in files_in_dir):
+                project_type = "Angular"
+            elif any(f in ["next.config.js", "next.config.ts"] for f in files_in_dir):
+                project_type = "Next.js"
+            elif any(f in ["svelte.config.js"] for f in files_in_dir):
+                project_type = "Svelte"
+            else:
+                # No framework config file - classify from the declared dependencies
+                package_name = next(n for n in manifest_names if n.lower() == "package.json")
+                package = self.manifest_cache.get(os.path.join(path, package_name))
+                project_type = (package and package["framework"]) or "Node.js"
+        elif "pubspec.yaml" in files_in_dir:
+            is_project = True
+            project_type = "Flutter"
+        elif any(f.endswith(".sln") or f.endswith(".csproj") or f.endswith(".vbproj") for f in files_in_dir):
+            if self.is_subfolder_of_project(path):
+                # If we are in a subfolder (e.g. csproj inside a sln folder), skip it
+                # UNLESS it is the SLN folder itself (which won't be a subfolder of another sln typically)
+                is_project = False
+            else:
+                is_project = True
+                project_type = "C# / .NET"
+        elif any(f in ["requirements.txt", "pyproject.toml", "setup.py", "pipfile", "poetry.lock"] for f in files_in_dir):
+            is_project = True
+            project_type = "Python"
+        elif any(f.endswith(".py") for f in files_in_dir) and len([f for f in files_in_dir if f.endswith(".py")]) > 1:
+            is_project = True
+            project_type = "Python Script"
+        elif "build.gradle" in files_in_dir or "build.gradle.kts" in files_in_dir:
+            # Check if this is part of a Flutter project
+            if self.is_subfolder_of_project(path):
+                is_project = False  # Skip as it's part of Flutter project
+            else:
+                is_project = True
+                project_type = "Android/Java/Kotlin"
+        elif "pom.xml" in files_in_dir:
+            is_project = True
+            project_type = "Java/Maven"
+        elif any(f.endswith(".xcodeproj") or f.endswith(".xcworkspace") for f in files_in_dir) or any(d.endswith(".xcodeproj") for d in dirs_in_dir):
+            # Check if this is part of a Flutter project
+            if self.is_subfolder_of_project(path):
+                is_project = False  # Skip as it's part of Flutter project
+            else:
+                is_project = True
+                project_type = "iOS"
+        elif any(f in ["go.mod", "go.sum"] for f in files_in_dir):
+            is_project = True
+            project_type = "Go"
+        elif any(f in ["cargo.toml"] for f in files_in_dir):
+            is_project = True
+            project_type = "Rust"
+        elif any(f in ["gemfile"] for f in files_in_dir):
+            is_project = True
+            project_type = "Ruby"
+        elif any(f in ["composer.json"] for f in files_in_dir) or any(f.endswith(".php") for f in files_in_dir):
+            if self.is_subfolder_of_project(path):
+                is_project = False
+            else:
+                is_php = False
+                if "composer.json" in files_in_dir:
+                    is_php = True
+                else:
+                    # Check for substantial PHP files to avoid false positives
+                    php_files = [f for f in files_in_dir if f.endswith(".php")]
+                    folder_name = os.path.basename(path).lower()
+                    
+                    # WordPress Plugin pattern: folder/folder.php or folder/folder-plugin.php
+                    # Also check for cleaned names (removing -master suffix)
+                    clean_name = folder_name.replace("-master", "").replace("-main", "")
+                    
+                    if f"{folder_name}.php" in php_files or f"{clean_name}.php" in php_files:
+                        is_php = True
+                    # Standard web entry point
+                    elif "index.php" in php_files:
+                         is_php = True
+                    # Project likely has a src folder and some php files
+                    elif os.path.exists(os.path.join(path, "src")) and os.path.isdir(os.path.join(path, "src")):
+                         is_php = True
+                    # Multiple PHP files likely mean a project (but careful with this if it's a subfolder)
+                    elif len(php_files) > 1:
+                         is_php = True
+                
+                if is_php:
+                    is_project = True
+                    project_type = "PHP"
+        elif any(f in ["cmakelists.txt"] for f in files_in_dir):
+            is_project = True
+            project_type = "C/C++"
+        elif any(f.endswith(".vcxproj") for f in files_in_dir):
+            is_project = True
+            project_type = "C++"
+        elif "index.html" in files_in_dir:
+            # Check if this is web folder in Flutter project
+            if self.is_subfolder_of_project(path):
+                is_project = False  # Skip as it's part of Flutter project
+            # Check if it's a vendor/library folder or lacks substantial files
+            elif self.is_vendor_or_library_folder(path, os.path.basename(path)):
+                is_project = False
+            elif not self.has_substantial_project_files(path, files_in_dir, "Web/HTML"):
+                is_project = False
+            else:
+                is_project = True
+                project_type = "Web/HTML"
+        elif "manage.py" in files_in_dir:
+            is_project = True
+            project_type = "Django"
+        elif any(f in ["mix.exs"] for f in files_in_dir):
+            is_project = True
+            project_type = "Elixir"
+        elif any(f in ["build.sbt"] for f in files_in_dir):
+            is_project = True
+            project_type = "Scala"
+        elif any(f in ["dub.json", "dub.sdl"] for f in files_in_dir):
+            is_project = True
+            project_type = "D"
+        elif has_git: # If none of above but has git, it's a project
+            is_project = True
+            project_type = "Git Repo"
+
+        dirs, projects = 1, 0
+        if is_project:
+            projects = 1
+            if manifest_names and self.metadata_pool:
+                self.metadata_pool.submit(self.extract_project_metadata, path, manifest_names)
+            git_status = ""
+            if has_git:
+                git_status = self.check_git_status(path)
+            
+            created_date, modified_date = self.get_directory_dates(path)
+            self.add_project(os.path.basename(path) or path, path, project_type, "Yes" if has_git else "No", git_status, created_date, modified_date)
+            # For git projects, only descend into nested repositories (submodules,
+            # worktrees, nested clones) instead of walking the whole working tree
+            if has_git:
+                for repo_path in self.find_nested_repositories(path, excluded_folders):
+                    if self.stop_requested: break
+                    sub_dirs, sub_projects = self.scan_directory(repo_path, excluded_folders, depth=depth+1)
+                    dirs += sub_dirs
+                    projects += sub_projects
+                return dirs, projects
+
+        for d in dirs_in_dir:
+            if self.stop_requested: break
+            sub_dirs, sub_projects = self.scan_directory(os.path.join(path, d), excluded_folders, depth=depth+1)
+            dirs += sub_dirs
+            projects += sub_projects
+
+        # Remember big subtrees (and ones seen before) to learn which are barren
+        if 1 <= depth <= PRUNE_MAX_DEPTH and (dirs >= PRUNE_MIN_DIRS or path in self.prune_history):
+            self.subtree_stats[path] = (dirs, projects)
+        return dirs, projects
+
+    def extract_project_metadata(self, path, manifest_names):
+        """Merge the parsed manifests of a project into one metadata record"""
+        metadata = {"manifests": {}, "dependencies": [], "scripts": {}, "framework": "", "language_version": ""}
+        for name in manifest_names:
+            data = self.manifest_cache.get(os.path.join(path, name))
+            if not data:
+                continue
+            metadata["manifests"][name.lower()] = data
+            metadata["dependencies"].extend(data["dependencies"])
+            for script, command in data["scripts"].items():
+                metadata["scripts"].setdefault(script, command)
+            metadata["framework"] = metadata["framework"] or data["framework"]
+            metadata["language_version"] = metadata["language_version"] or data["language_version"]
+        self.project_metadata[self.path_table.intern(path)] = metadata
+        return metadata
+
+    def add_project(self, name, path, p_type, git, status, created, modified):
+        path_id = self.path_table.intern(path)
+        if path_id in self.found_ids:
+            return
+        self.found_ids.add(path_id)
+        self.projects_added_count += 1
+        # Records keep the path id only, display strings are rebuilt by project_rows()
+        self.projects.append((path_id, p_type, git, status, created, modified))
+        if git == "Yes":
+            self.index_repository(path)
+        self.on_project((name, path, p_type, git, status, created, modified))
+
+    def project_rows(self):
+        """Result records as display rows (name, path, type, git, status, created, modified)"""
+        rows = []
+        for path_id, p_type, git, status, created, modified in self.projects:
+            path = self.path_table.path(path_id)
+            rows.append((os.path.basename(path) or path, path, p_type, git, status, created, modified))
+        return rows
+
+
+# Headless index daemon, queried over a named pipe (Windows) or Unix socket
+DAEMON_ADDRESS = r"\\.\pipe\project_scout" if os.name == 'nt' else os.path.join(APP_DATA_DIR, "daemon.sock")
+DAEMON_FAMILY = "AF_PIPE" if os.name == 'nt' else "AF_UNIX"
+DAEMON_REFRESH_MINUTES = 30
+MAX_REQUEST_SIZE = 64 * 1024
+MAX_QUERY_NUMBERS = {"recent_days": 36500, "limit": 100000}  # Upper bounds for numeric query fields
+
+
+def fuzzy_score(query, text):
+    """Score a fuzzy (subsequence) match of query in text, higher is better.
+    Returns None when the query characters don't all appear in order."""
+    if not query:
+        return 0.0
+    score = 0.0
+    pos = prev = -1
+    for ch in query:
+        pos = text.find(ch, pos + 1)
+        if pos < 0:
+            return None
+        score += 3 if pos == prev + 1 else 1  # Consecutive characters count more
+        prev = pos
+    if text.startswith(query):
+        score += 10
+    elif query in text:
+        score += 5
+    return score - len(text) * 0.01  # Prefer shorter names on ties
+
+
+class ProjectIndex:
+    """Immutable in-memory project list answering daemon queries"""
+
+    def __init__(self, rows):
+        self.rows = [dict(zip(SNAPSHOT_COLUMNS, row)) for row in rows]
+        self.names = [row["name"].lower() for row in self.rows]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def query(self, text="", p_type="", status="", recent_days=None, limit=50):
+        """Projects matching all given filters.
+
+        text: fuzzy match on project name, best matches first
+        p_type: case-insensitive substring of the project type
+        status: git status (Clean, Dirty, ...) or "git" / "nogit"
+        recent_days: only projects modified within that many days, newest first
+        """
+        text = text.lower()
+        cutoff = None
+        if recent_days is not None:
+            from datetime import timedelta
+            cutoff = (datetime.now() - timedelta(days=recent_days)).strftime("%Y-%m-%d %H:%M")
+
+        matches = []
+        for row, name in zip(self.rows, self.names):
+            if p_type and p_type.lower() not in row["type"].lower():
+                continue
+            if status:
+                if status.lower() == "git":
+                    if row["git"] != "Yes":
+                        continue
+                elif status.lower() == "nogit":
+                    if row["git"] == "Yes":
+                        continue
+                elif row["status"].lower() != status.lower():
+                    continue
+            # Dates are stored as 'YYYY-MM-DD HH:MM', so they compare as strings
+            if cutoff and (row["modified"] == "Unknown" or row["modified"] < cutoff):
+                continue
+            score = fuzzy_score(text, name)
+            if score is None:
+                continue
+            matches.append((score, row))
+
+        if text:
+            matches.sort(key=lambda m: m[0], reverse=True)
+        elif cutoff:
+            matches.sort(key=lambda m: m[1]["modified"], reverse=True)
+        return [row for _, row in matches[:limit]]
+
+
+class IndexDaemon:
+    """Keeps the project index warm and answers queries from other tools.
+
+    Requests and responses are JSON objects sent as single messages over a
+    multiprocessing.connection pipe/socket. Queries are served from memory;
+    the index is refreshed by a background rescan and swapped in when done.
+    """
+
+    def __init__(self, address=DAEMON_ADDRESS, refresh_minutes=DAEMON_REFRESH_MINUTES, follow_links=False,
+                 full_scan=False):
+        self.address = address
+        self.refresh_seconds = refresh_minutes * 60
+        self.scanner = ProjectScanner(on_status=self.log, follow_links=follow_links, full_scan=full_scan)
+        self.index = ProjectIndex([])
+        self.indexed_at = None
+        self.refreshing = False
+        self.refresh_requested = threading.Event()
+        self.listener = None
+        self.running = False
+
+    def log(self, text):
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {text}", flush=True)
+
+    def load_last_snapshot(self):
+        """Serve the last saved scan until the first refresh finishes"""
+        snapshots = list_snapshots()
+        if not snapshots:
+            return
+        try:
+            snapshot = load_snapshot(snapshots[-1])
+            self.index = ProjectIndex(snapshot["rows"])
+        except (OSError, ValueError):
+            return
+        self.indexed_at = snapshot["taken"]
+        self.log(f"Loaded {len(self.index)} projects from snapshot {snapshot['taken']}")
+
+    def serve_forever(self):
+        from multiprocessing.connection import Listener
+        self.load_last_snapshot()
+        if DAEMON_FAMILY == "AF_UNIX":
+            os.makedirs(os.path.dirname(self.address), exist_ok=True)
+        # A second named pipe instance on Windows would silently share the name, so always ping first
+        try:
+            query_daemon({"op": "ping"}, self.address)
+            raise RuntimeError(f"A daemon is already listening on {self.address}")
+        except OSError:
+            if DAEMON_FAMILY == "AF_UNIX" and os.path.exists(self.address):
+                os.remove(self.address)  # Left over from a daemon that died
+        self.listener = Listener(self.address, family=DAEMON_FAMILY)
+        if DAEMON_FAMILY == "AF_UNIX":
+            os.chmod(self.address, 0o600)
+        self.running = True
+        self.log(f"Listening on {self.address}")
+
+        threading.Thread(target=self.refresh_loop, daemon=True).start()
+        try:
+            while self.running:
+                try:
+                    conn = self.listener.accept()
+                except OSError:
+                    break
+                if not self.running:
+                    conn.close()  # Wake-up connection from shutdown
+                    break
+                threading.Thread(target=self.handle_connection, args=(conn,), daemon=True).start()
+        finally:
+            self.running = False
+            self.scanner.stop_requested = True
+            self.listener.close()
+
+    def handle_connection(self, conn):
+        import json
+        with conn:
+            while self.running:
+                try:
+                    request = json.loads(conn.recv_bytes(MAX_REQUEST_SIZE))
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                    response = self.handle_request(request)
+                except (EOFError, OSError):
+                    return
+                except (TypeError, ValueError, OverflowError) as e:
+                    response = {"ok": False, "error": f"Bad request: {e}"}
+                try:
+                    conn.send_bytes(json.dumps(response).encode("utf-8"))
+                except OSError:
+                    return
+        # Stopped by a shutdown request. accept() is not interrupted by closing
+        # the listener, so connect once to wake it up.
+        self.wake_listener()
+
+    def handle_request(self, request):
+        op = request.get("op", "query")
+        started = time.perf_counter()
+        if op == "query":
+            for field in ("text", "type", "status"):
+                if not isinstance(request.get(field, ""), str):
+                    raise ValueError(f"'{field}' must be a string")
+            import math
+            for field, value in (("recent_days", request.get("recent_days", 0)), ("limit", request.get("limit", 50))):
+                if field == "recent_days" and value is None:
+                    continue
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                    raise ValueError(f"'{field}' must be a finite number")
+                if not 0 <= value <= MAX_QUERY_NUMBERS[field]:
+                    raise ValueError(f"'{field}' must be between 0 and {MAX_QUERY_NUMBERS[field]}")
+            index = self.index  # Refreshes swap the index, never modify it
+            results = index.query(
+                text=request.get("text", ""),
+                p_type=request.get("type", ""),
+                status=request.get("status", ""),
+                recent_days=request.get("recent_days"),
+                limit=int(request.get("limit", 50)),
+            )
+            return {"ok": True, "results": results,
+                    "took_ms": round((time.perf_counter() - started) * 1000, 3)}
+        if op in ("ping", "status"):
+            return {"ok": True, "projects": len(self.index), "indexed_at": self.indexed_at,
+                    "refreshing": self.refreshing}
+        if op == "refresh":
+            self.refresh_requested.set()
+            return {"ok": True, "refreshing": True}
+        if op == "shutdown":
+            self.running = False  # Listener is woken up once the response is sent
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    def wake_listener(self):
+        from multiprocessing.connection import Client
+        try:
+            Client(self.address, family=DAEMON_FAMILY).close()
+        except OSError:
+            pass
+
+    def refresh_loop(self):
+        """Rescan on start (unless the snapshot is fresh) and then periodically"""
+        wait = 0
+        if self.indexed_at:
+            age = (datetime.now() - datetime.strptime(self.indexed_at, "%Y-%m-%d %H:%M:%S")).total_seconds()
+            wait = max(0, self.refresh_seconds - age)
+        while self.running:
+            self.refresh_requested.wait(timeout=wait)
+            self.refresh_requested.clear()
+            if not self.running:
                 break
-                
-            # Check for project markers in this parent directory
-            try:
-                # Indicators that suggest the parent is the REAL project root
-                indicators = [
-                    ".git", "package.json", "composer.json", "pubspec.yaml",
-                    "go.mod", "Cargo.toml", "pom.xml", "manage.py", "requirements.txt",
-                    "mix.exs", "build.sbt", ".gitignore", "Makefile",
-                    "webpack.config.js", "rollup.config.js"
-                ]
-                
-                # Check for WordPress Theme (style.css + functions.php)
-                if os.path.exists(os.path.join(parent, "style.css")) and \
-                   os.path.exists(os.path.join(parent, "functions.php")):
-                    return True
-                
-                # Check for standard indicators
-                for indicator in indicators:
-                    if os.path.exists(os.path.join(parent, indicator)):
-                        return True
-                        
-                # Check if parent has a "src" directory (strong indicator of project root)
-                if os.path.exists(os.path.join(parent, "src")) and os.path.isdir(os.path.join(parent, "src")):
-                    return True
+            self.refresh()
+            wait = self.refresh_seconds
 
-                # Check for Visual Studio Solution in parent
-                if any(f.endswith(".sln") for f in os.listdir(parent)):
-                    return True
+    def refresh(self):
+        self.refreshing = True
+        self.scanner.reset()
+        try:
+            if self.scanner.run():
+                self.index = ProjectIndex(self.scanner.project_rows())
+                self.indexed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        finally:
+            self.refreshing = False
 
-                # Check if parent matches "folder/folder.php" (WP Plugin) pattern
-                parent_name = os.path.basename(parent).lower()
-                clean_name = parent_name.replace("-master", "").replace("-main", "")
-                
-                # Check for exact match or cleaned match
-                if os.path.exists(os.path.join(parent, f"{parent_name}.php")) or \
-                   os.path.exists(os.path.join(parent, f"{clean_name}.php")):
-                    return True
-                        
-            except (PermissionError, OSError):
-                pass
-            
-            # Move up
-            current = parent
-            parent = os.path.dirname(current)
-            
-        return False
 
-    def format_path_for_display(self, path, max_depth=3):
-        """Format path for display showing only first max_depth levels"""
-        parts = Path(path).parts
-        if len(parts) <= max_depth + 1:
-            return path
-        # Show first max_depth parts, then last part if not too long
-        first_parts = list(parts[:max_depth])
-        last_part = parts[-1]
-        if len(last_part) > 30:
-            last_part = last_part[:27] + "..."
-        return os.path.join(*first_parts, "...", last_part)
+def query_daemon(request, address=DAEMON_ADDRESS):
+    """Send one request to a running daemon and return its response"""
+    import json
+    from multiprocessing.connection import Client
+    with Client(address, family=DAEMON_FAMILY) as conn:
+        conn.send_bytes(json.dumps(request).encode("utf-8"))
+        return json.loads(conn.recv_bytes())
 
-    def is_vendor_or_library_folder(self, path, folder_name):
-        """Check if folder is likely a vendor/library folder, not a real project"""
-        folder_lower = folder_name.lower()
-        path_lower = path.lower()
-        
-        # Common vendor/library folder patterns
-        vendor_patterns = [
-            "vendor", "vendors", "third-party", "thirdparty", "external",
-            "packages", "libs", "libraries", "dependencies",
-            "bower_components", "jspm_packages",
-            "mode", "modes",  # CodeMirror modes
-            "addons", "add-ons", "plugins", "extensions", "modules"
-        ]
-        
-        # Check if folder name matches vendor patterns
-        if any(pattern in folder_lower for pattern in vendor_patterns):
-            return True
+
+def print_query_results(args):
+    """CLI client for the daemon"""
+    import json
+    request = {"op": "query", "text": args.query, "type": args.type, "status": args.status,
+               "recent_days": args.recent, "limit": args.limit}
+    try:
+        response = query_daemon(request)
+    except OSError:
+        print("Error: Project Scout daemon is not running (start it with --daemon)")
+        return 1
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}")
+        return 1
+    if args.json:
+        print(json.dumps(response["results"], indent=2))
+    elif args.paths:
+        for row in response["results"]:
+            print(row["path"])
+    else:
+        for row in response["results"]:
+            print(f"{row['name']:<30} {row['type']:<20} {row['status'] or '-':<8} {row['modified']:<16} {row['path']}")
+    return 0
+
+
+class ProjectScoutApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Project Scout - Find Your Projects")
+        self.root.geometry("1200x600")
+
+        self.scanning = False
+        self.scanner = ProjectScanner(on_project=self.show_project, on_status=self.update_status)
+        self.revalidating = False
+        self.visible_items = ()  # Rows currently on screen, revalidated first
+        self.snapshot_loading = None  # (rows, row order, inserted rows) while the last scan is added
+        self.setup_ui()
+        self.current_theme = self.get_system_theme()
+        self.apply_theme(self.current_theme)
+        # Show the previous results right away instead of an empty list
+        self.load_last_snapshot()
+
+    def setup_ui(self):
+        # Top Controls
+        control_frame = ttk.Frame(self.root, padding="10")
+        control_frame.pack(fill=tk.X)
+
+        self.status_label = ttk.Label(control_frame, text="Click 'Start Scan' to begin searching...")
+        self.status_label.pack(side=tk.LEFT, padx=5)
+
+        self.scan_btn = ttk.Button(control_frame, text="Start Scan", command=self.toggle_scan)
+        self.scan_btn.pack(side=tk.RIGHT, padx=5)
+
+        self.theme_btn = ttk.Button(control_frame, text="☾", width=3, command=self.toggle_theme)
+        self.theme_btn.pack(side=tk.RIGHT, padx=5)
+
+        self.full_scan_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="Full scan", variable=self.full_scan_var).pack(side=tk.RIGHT, padx=5)
+
+        self.follow_links_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="Follow links", variable=self.follow_links_var).pack(side=tk.RIGHT, padx=5)
+
+        # Treeview for Projects
+        columns = ("name", "path", "type", "git", "status", "created", "modified")
+        self.tree = ttk.Treeview(self.root, columns=columns, show="headings")
+        self.tree.heading("name", text="Project Name", command=lambda: self.sort_by_column("name"))
+        self.tree.heading("path", text="Directory Path", command=lambda: self.sort_by_column("path"))
+        self.tree.heading("type", text="Type", command=lambda: self.sort_by_column("type"))
+        self.tree.heading("git", text="Git", command=lambda: self.sort_by_column("git"))
+        self.tree.heading("status", text="Git Status", command=lambda: self.sort_by_column("status"))
+        self.tree.heading("created", text="Created", command=lambda: self.sort_by_column("created"))
+        self.tree.heading("modified", text="Modified", command=lambda: self.sort_by_column("modified"))
+
+        self.tree.column("name", width=120)
+        self.tree.column("path", width=350)
+        self.tree.column("type", width=100)
+        self.tree.column("git", width=50)
+        self.tree.column("status", width=80)
+        self.tree.column("created", width=120)
+        self.tree.column("modified", width=120)
         
-        # Check if path contains WordPress/CMS indicators
-        cms_indicators = [
-            "wp-content", "wordpress", "joomla", "drupal", "elementor",
-            "essential-addons", "epic-news", "eventful", "astra"
-        ]
-        if any(indicator in path_lower for indicator in cms_indicators):
-            return True
+        self.sort_reverse = {}  # Track sort direction for each column
+
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        # Scrollbar
+        self.scrollbar = ttk.Scrollbar(self.tree, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscroll=self.on_tree_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Bottom Buttons
+        bottom_frame = ttk.Frame(self.root, padding="10")
+        bottom_frame.pack(fill=tk.X)
+
+        ttk.Button(bottom_frame, text="Run Project", command=self.run_project).pack(side=tk.LEFT, padx=5)
+        ttk.Button(bottom_frame, text="Open in Explorer", command=self.open_in_explorer).pack(side=tk.LEFT, padx=5)
+        ttk.Button(bottom_frame, text="Open with Antigravity", command=self.open_with_antigravity).pack(side=tk.LEFT, padx=5)
+        ttk.Button(bottom_frame, text="Export to CSV", command=self.export_to_csv).pack(side=tk.LEFT, padx=5)
+        ttk.Button(bottom_frame, text="Compare Scans", command=self.show_scan_diff).pack(side=tk.LEFT, padx=5)
+        ttk.Button(bottom_frame, text="Duplicate Clones", command=self.show_duplicate_clones).pack(side=tk.LEFT, padx=5)
+
+        self.hide_clones_var = tk.BooleanVar(value=False)
+        self.hidden_clones = {}  # Detached clone row -> its index in the full list, restored when unchecked
+        ttk.Checkbutton(bottom_frame, text="Hide duplicate clones", variable=self.hide_clones_var,
+                        command=self.toggle_hide_clones).pack(side=tk.LEFT, padx=5)
         
-        # Check if it's a documentation folder with only index.html
-        if "documentation" in folder_lower or "docs" == folder_lower:
-            return True
-            
-        return False
+        # Color tags
+        self.tree.tag_configure("git_yes", background="#e1f5fe") # Light blue for git projects
+        self.tree.tag_configure("dirty", foreground="#d32f2f")   # Red text for uncommitted changes
+        self.tree.tag_configure("clone", background="#fff8e1")   # Light yellow for duplicate clones
+        self.tree.tag_configure("stale", foreground="#8a8a8a")   # Grey text for rows not yet revalidated
 
-    def has_substantial_project_files(self, path, files_in_dir, project_type):
-        """Check if folder has substantial project files, not just one index.html"""
+    def get_system_theme(self):
+        try:
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
+            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+            winreg.CloseKey(key)
+            return "Light" if value == 1 else "Dark"
+        except Exception:
+            return "Light"
+
+    def toggle_theme(self):
+        new_theme = "Dark" if self.current_theme == "Light" else "Light"
+        self.apply_theme(new_theme)
+
+    def apply_theme(self, theme):
+        self.current_theme = theme
+        style = ttk.Style(self.root)
+        style.theme_use("clam")
         
-        # For HTML projects, require more than just index.html
-        if project_type == "Web/HTML":
-            # Check if there are other meaningful files
-            html_files = [f for f in files_in_dir if f.endswith(".html")]
-            js_files = [f for f in files_in_dir if f.endswith(".js")]
-            css_files = [f for f in files_in_dir if f.endswith(".css")]
+        if theme == "Dark":
+            bg = "#2b2b2b"
+            fg = "#ffffff"
+            field_bg = "#383838"
             
-            # If only index.html exists with no other meaningful files, skip it
-            if len(html_files) == 1 and len(js_files) == 0 and len(css_files) == 0:
-                return False
+            self.root.configure(bg=bg)
+            style.configure(".", background=bg, foreground=fg, fieldbackground=field_bg)
+            style.configure("Treeview", background="#383838", foreground=fg, fieldbackground="#383838")
+            style.configure("Treeview.Heading", background="#404040", foreground=fg, relief="flat")
+            style.map("Treeview", background=[("selected", "#005a9e")])
+            
+            style.configure("TButton", background="#404040", foreground=fg, bordercolor="#505050")
+            style.map("TButton", background=[("active", "#505050")])
+            
+            # Update tags for Dark Mode
+            self.tree.tag_configure("git_yes", background="#1e3a50")
+            self.tree.tag_configure("dirty", foreground="#ff6b6b")
+            self.tree.tag_configure("clone", background="#4a3f1e")
+            
+            if hasattr(self, 'theme_btn'):
+                self.theme_btn.config(text="☀")
                 
-            # Check for common non-project patterns
-            folder_name = os.path.basename(path).lower()
-            non_project_names = [
-                "mode", "modes", "theme", "addon", "plugin", "extension",
-                "help", "about", "documentation", "demo", "example", "sample"
-            ]
-            if any(name in folder_name for name in non_project_names):
-                return False
-        
-        return True
-
-    def scan_directory(self, path, excluded_folders, depth=0):
-        # Update status more frequently - every folder at depth 0-2, every 5th at depth 3-5, etc.
-        self.status_update_counter += 1
-        should_update = False
-        
-        if depth <= 2:
-            should_update = True  # Always update for top 3 levels
-        elif depth == 3 and self.status_update_counter % 5 == 0:
-            should_update = True  # Every 5th folder at depth 3
-        elif depth == 4 and self.status_update_counter % 10 == 0:
-            should_update = True  # Every 10th folder at depth 4
-        elif depth <= 5 and self.status_update_counter % 20 == 0:
-            should_update = True  # Every 20th folder at depth 5
-        
-        if should_update:
-            display_path = self.format_path_for_display(path, max_depth=3)
-            self.update_status(f"Scanning: {display_path}... (Found: {self.projects_added_count})")
-            # Force GUI update to process the queue
+            # Windows Title Bar Dark
+            try:
+                import ctypes
+                # DWMWA_USE_IMMERSIVE_DARK_MODE = 20
+                hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+                value = ctypes.c_int(1)
+                ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, 20, ctypes.byref(value), ctypes.sizeof(value))
+            except:
+                pass
+                
+        else:
+            bg = "#f0f0f0"
+            fg = "#000000"
+            
+            self.root.configure(bg=bg)
+            style.configure(".", background=bg, foreground=fg)
+            style.configure("Treeview", background="white", foreground="black", fieldbackground="white")
+            style.configure("Treeview.Heading", background="#f0f0f0", foreground="black")
+            style.map("Treeview", background=[("selected", "#0078d7")])
+            
+            style.configure("TButton", background="#e1e1e1", foreground="black")
+            style.map("TButton", background=[("active", "#e5f1fb")])
+            
+            # Update tags for Light Mode
+            self.tree.tag_configure("git_yes", background="#e1f5fe")
+            self.tree.tag_configure("dirty", foreground="#d32f2f")
+            self.tree.tag_configure("clone", background="#fff8e1")
+            
+            if hasattr(self, 'theme_btn'):
+                self.theme_btn.config(text="☾")
+                
+            # Windows Title Bar Light
             try:
-                self.root.update_idletasks()
+                import ctypes
+                hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+                value = ctypes.c_int(0)
+                ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, 20, ctypes.byref(value), ctypes.sizeof(value))
             except:
                 pass
-        
-        try:
-            entries = list(os.scandir(path))
-        except PermissionError:
-            return
-        except Exception:
-            return
 
-        is_project = False
-        project_type = ""
-        has_git = False
+    def toggle_scan(self):
+        if self.scanning:
+            self.scanner.stop_requested = True
+            self.status_label.config(text="Stopping scan...")
+        else:
+            self.start_scan()
 
-        files_in_dir = []
-        dirs_in_dir = []
+    def start_scan(self):
+        self.revalidating = False  # A fresh scan replaces the loaded snapshot
+        self.snapshot_loading = None
+        self.scanner.reset()
+        self.hidden_clones = {}
+        self.scanner.follow_links = self.follow_links_var.get()
+        self.scanner.full_scan = self.full_scan_var.get()
+        for i in self.tree.get_children():
+            self.tree.delete(i)
         
-        for entry in entries:
-            try:
-                name_lower = entry.name.lower()
-                if entry.is_file():
-                    files_in_dir.append(name_lower)
-                elif entry.is_dir():
-                    if name_lower == ".git":
-                        has_git = True
-                    elif entry.name.startswith("."):
-                        continue
-                    elif name_lower in excluded_folders:
-                        continue
-                    elif self.is_portable_browser_folder(entry.name):
-                        continue
-                    else:
-                        dirs_in_dir.append(entry)
-            except (PermissionError, OSError):
-                continue
+        self.scanning = True
+        self.scan_btn.config(text="Stop Scan")
+        
+        # Start scanning in a background thread
+        thread = threading.Thread(target=self.run_scanner, daemon=True)
+        thread.start()
+        self.root.after(PROGRESS_INTERVAL_MS, self.refresh_progress)
 
-        # Identification Logic
-        if "package.json" in files_in_dir:
-            is_project = True
-            # Check for specific frameworks
-            if any(f in ["vite.config.js", "vite.config.ts"] for f in files_in_dir):
-                project_type = "Vite"
-            elif any(f in ["vue.config.js", "nuxt.config.js"] for f in files_in_dir):
-                project_type = "Vue.js"
-            elif any(f in ["angular.json"] for f in files_in_dir):
-                project_type = "Angular"
-            elif any(f in ["next.config.js", "next.config.ts"] for f in files_in_dir):
-                project_type = "Next.js"
-            elif any(f in ["svelte.config.js"] for f in files_in_dir):
-                project_type = "Svelte"
-            elif any(d.name in ["src", "public"] for d in dirs_in_dir) or any(f in ["tsconfig.json", "jsconfig.json"] for f in files_in_dir):
-                # Check if it's React by looking for common React indicators
-                package_json_path = os.path.join(path, "package.json")
-                if os.path.exists(package_json_path):
-                    try:
-                        with open(package_json_path, 'r', encoding='utf-8') as f:
-                            content = f.read().lower()
-                            if "react" in content or "react-scripts" in content:
-                                project_type = "React"
-                            else:
-                                project_type = "Node.js"
-                    except:
-                        project_type = "React"  # Default to React if we can't read
-                else:
-                    project_type = "React"
-            else:
-                project_type = "Node.js"
-        elif "pubspec.yaml" in files_in_dir:
-            is_project = True
-            project_type = "Flutter"
-        elif any(f.endswith(".sln") or f.endswith(".csproj") or f.endswith(".vbproj") for f in files_in_dir):
-            if self.is_subfolder_of_project(path):
-                # If we are in a subfolder (e.g. csproj inside a sln folder), skip it
-                # UNLESS it is the SLN folder itself (which won't be a subfolder of another sln typically)
-                is_project = False
-            else:
-                is_project = True
-                project_type = "C# / .NET"
-        elif any(f in ["requirements.txt", "pyproject.toml", "setup.py", "pipfile", "poetry.lock"] for f in files_in_dir):
-            is_project = True
-            project_type = "Python"
-        elif any(f.endswith(".py") for f in files_in_dir) and len([f for f in files_in_dir if f.endswith(".py")]) > 1:
-            is_project = True
-            project_type = "Python Script"
-        elif "build.gradle" in files_in_dir or "build.gradle.kts" in files_in_dir:
-            # Check if this is part of a Flutter project
-            if self.is_subfolder_of_project(path):
-                is_project = False  # Skip as it's part of Flutter project
-            else:
-                is_project = True
-                project_type = "Android/Java/Kotlin"
-        elif "pom.xml" in files_in_dir:
-            is_project = True
-            project_type = "Java/Maven"
-        elif any(f.endswith(".xcodeproj") or f.endswith(".xcworkspace") for f in files_in_dir) or any(d.name.endswith(".xcodeproj") for d in dirs_in_dir):
-            # Check if this is part of a Flutter project
-            if self.is_subfolder_of_project(path):
-                is_project = False  # Skip as it's part of Flutter project
-            else:
-                is_project = True
-                project_type = "iOS"
-        elif any(f in ["go.mod", "go.sum"] for f in files_in_dir):
-            is_project = True
-            project_type = "Go"
-        elif any(f in ["Cargo.toml"] for f in files_in_dir):
-            is_project = True
-            project_type = "Rust"
-        elif any(f in ["Gemfile"] for f in files_in_dir):
-            is_project = True
-            project_type = "Ruby"
-        elif any(f in ["composer.json"] for f in files_in_dir) or any(f.endswith(".php") for f in files_in_dir):
-            if self.is_subfolder_of_project(path):
-                is_project = False
-            else:
-                is_php = False
-                if "composer.json" in files_in_dir:
-                    is_php = True
-                else:
-                    # Check for substantial PHP files to avoid false positives
-                    php_files = [f for f in files_in_dir if f.endswith(".php")]
-                    folder_name = os.path.basename(path).lower()
-                    
-                    # WordPress Plugin pattern: folder/folder.php or folder/folder-plugin.php
-                    # Also check for cleaned names (removing -master suffix)
-                    clean_name = folder_name.replace("-master", "").replace("-main", "")
-                    
-                    if f"{folder_name}.php" in php_files or f"{clean_name}.php" in php_files:
-                        is_php = True
-                    # Standard web entry point
-                    elif "index.php" in php_files:
-                         is_php = True
-                    # Project likely has a src folder and some php files
-                    elif os.path.exists(os.path.join(path, "src")) and os.path.isdir(os.path.join(path, "src")):
-                         is_php = True
-                    # Multiple PHP files likely mean a project (but careful with this if it's a subfolder)
-                    elif len(php_files) > 1:
-                         is_php = True
-                
-                if is_php:
-                    is_project = True
-                    project_type = "PHP"
-        elif any(f in ["CMakeLists.txt"] for f in files_in_dir):
-            is_project = True
-            project_type = "C/C++"
-        elif any(f.endswith(".vcxproj") for f in files_in_dir):
-            is_project = True
-            project_type = "C++"
-        elif "index.html" in files_in_dir:
-            # Check if this is web folder in Flutter project
-            if self.is_subfolder_of_project(path):
-                is_project = False  # Skip as it's part of Flutter project
-            # Check if it's a vendor/library folder or lacks substantial files
-            elif self.is_vendor_or_library_folder(path, os.path.basename(path)):
-                is_project = False
-            elif not self.has_substantial_project_files(path, files_in_dir, "Web/HTML"):
-                is_project = False
-            else:
-                is_project = True
-                project_type = "Web/HTML"
-        elif "manage.py" in files_in_dir:
-            is_project = True
-            project_type = "Django"
-        elif any(f in ["mix.exs"] for f in files_in_dir):
-            is_project = True
-            project_type = "Elixir"
-        elif any(f in ["build.sbt"] for f in files_in_dir):
-            is_project = True
-            project_type = "Scala"
-        elif any(f in ["dub.json", "dub.sdl"] for f in files_in_dir):
-            is_project = True
-            project_type = "D"
-        elif has_git: # If none of above but has git, it's a project
-            is_project = True
-            project_type = "Git Repo"
+    def run_scanner(self):
+        self.scanner.run()
+        self.scanning = False
+        self.root.after(0, lambda: self.scan_btn.config(text="Start Scan"))
 
-        if is_project:
-            git_status = ""
-            if has_git:
-                git_status = self.check_git_status(path)
-            
-            created_date, modified_date = self.get_directory_dates(path)
-            self.add_project(os.path.basename(path) or path, path, project_type, "Yes" if has_git else "No", git_status, created_date, modified_date)
-            # Exclude subfolders ONLY if project has active git AND no subfolder has git
-            if has_git:
-                has_subfolder_with_git = any(os.path.isdir(os.path.join(d.path, ".git")) for d in dirs_in_dir)
-                if not has_subfolder_with_git:
-                    # Exclude all subfolders - don't scan them
-                    dirs_in_dir = []
+    def refresh_progress(self):
+        """Timer on the GUI thread: show path, percent, rate and ETA at a fixed rate"""
+        if not self.scanning:
+            return
+        progress = self.scanner.progress
+        if progress is None:
+            self.status_label.config(text="Estimating scan size...")
+        elif not self.scanner.stop_requested:
+            display_path = self.format_path_for_display(self.scanner.current_scan_path, max_depth=3)
+            eta = progress.eta()
+            eta_text = format_duration(eta) if eta is not None else "?"
+            self.status_label.config(
+                text=f"Scanning: {display_path}... (Found: {self.scanner.projects_added_count}) - "
+                     f"{progress.percent():.0f}%, {progress.rate():.0f} folders/s, ETA {eta_text}")
+        self.root.after(PROGRESS_INTERVAL_MS, self.refresh_progress)
 
-        for d in dirs_in_dir:
-            if self.stop_requested: break
-            self.scan_directory(d.path, excluded_folders, depth=depth+1)
+    def format_path_for_display(self, path, max_depth=3):
+        """Format path for display showing only first max_depth levels"""
+        parts = Path(path).parts
+        if len(parts) <= max_depth + 1:
+            return path
+        # Show first max_depth parts, then last part if not too long
+        first_parts = list(parts[:max_depth])
+        last_part = parts[-1]
+        if len(last_part) > 30:
+            last_part = last_part[:27] + "..."
+        return os.path.join(*first_parts, "...", last_part)
+
+    def show_project(self, values_tuple):
+        """Scanner callback: add a found project to the list"""
+        git = values_tuple[3]
+        tags_tuple = self.project_tags(values_tuple)
 
-    def add_project(self, name, path, p_type, git, status, created, modified):
-        if path in self.found_paths:
-            return
-        self.found_paths.add(path)
-        self.projects_added_count += 1
-        
-        tags = []
-        if git == "Yes":
-            tags.append("git_yes")
-        if status == "Dirty":
-            tags.append("dirty")
-        
-        # Capture values in closure to avoid late binding
-        values_tuple = (name, path, p_type, git, status, created, modified)
-        tags_tuple = tuple(tags)
-        
         # Inserting at index 0 if it's git, otherwise at the end
         def insert_item():
             try:
                 if git == "Yes":
-                    self.tree.insert("", 0, values=values_tuple, tags=tags_tuple)
+                    item_id = self.tree.insert("", 0, values=values_tuple, tags=tags_tuple)
                 else:
-                    self.tree.insert("", tk.END, values=values_tuple, tags=tags_tuple)
+                    item_id = self.tree.insert("", tk.END, values=values_tuple, tags=tags_tuple)
+                if "clone" in tags_tuple and self.hide_clones_var.get():
+                    self.hide_row(item_id)
             except:
                 pass
         
         self.root.after_idle(insert_item)
         
         # Force GUI update every 5 projects to show progress
-        if self.projects_added_count % 5 == 0:
+        if self.scanner.projects_added_count % 5 == 0:
             try:
                 self.root.update_idletasks()
             except:
                 pass
 
+    def project_tags(self, values, stale=False):
+        """Treeview tags for a row of project values"""
+        tags = []
+        if values[3] == "Yes":
+            tags.append("git_yes")
+        if values[4] == "Dirty":
+            tags.append("dirty")
+        if values[3] == "Yes" and self.scanner.duplicate_of(values[1]):
+            tags.append("clone")
+        if stale:
+            tags.append("stale")
+        return tuple(tags)
+
+    def load_last_snapshot(self):
+        """Show the results of the last completed scan, marked as possibly stale"""
+        snapshots = list_snapshots()
+        if not snapshots:
+            return
+        try:
+            snapshot = load_snapshot(snapshots[-1])
+            rows = snapshot["rows"]
+            # Git projects first, same as during a scan. Only the git column is read
+            # here, whole rows are decoded batch by batch as they are inserted.
+            git_col = SNAPSHOT_COLUMNS.index("git")
+            value = rows.value if isinstance(rows, SnapshotReader) else (lambda column, i: rows[i][column])
+            is_git = [value(git_col, i) == "Yes" for i in range(len(rows))]
+        except (OSError, ValueError):
+            return
+
+        order = [i for i in range(len(rows)) if is_git[i]] + [i for i in range(len(rows)) if not is_git[i]]
+        self.status_label.config(
+            text=f"Showing {len(rows)} projects from last scan ({snapshot['taken']}) - may be outdated, revalidating...")
+        self.snapshot_loading = (rows, iter(order), {})
+        self.insert_snapshot_rows(self.snapshot_loading)
+
+    def insert_snapshot_rows(self, loading):
+        """Add the next batch of last-scan rows; the first batch fills the screen right away"""
+        if self.snapshot_loading is not loading:
+            return  # A new scan replaced the list
+        rows, order, pending = loading
+        inserted = 0
+        try:
+            for i in order:
+                row = rows[i]
+                item_id = self.tree.insert("", tk.END, values=row, tags=self.project_tags(row, stale=True))
+                pending[item_id] = row
+                inserted += 1
+                if inserted == SNAPSHOT_DISPLAY_BATCH:
+                    self.root.after(1, lambda: self.insert_snapshot_rows(loading))
+                    return
+        except ValueError as e:
+            self.status_label.config(text=f"Could not load all projects from last scan: {e}")
+        # Revalidation starts once every row is in the list
+        self.snapshot_loading = None
+        if pending:
+            self.start_revalidation(pending)
+
+    def on_tree_scroll(self, first, last):
+        """Scroll callback: update the scrollbar and remember which rows are visible"""
+        self.scrollbar.set(first, last)
+        if self.revalidating:
+            children = self.tree.get_children("")
+            start = int(float(first) * len(children))
+            end = int(float(last) * len(children)) + 1
+            self.visible_items = children[start:end]
+
+    def start_revalidation(self, pending):
+        """Re-check loaded rows (item id -> values) in a background thread, visible rows first"""
+        self.revalidating = True
+        thread = threading.Thread(target=self.revalidate_rows, args=(pending,), daemon=True)
+        thread.start()
+
+    def revalidate_rows(self, pending):
+        """Worker: check existence, dates and git status of each pending row"""
+        total = len(pending)
+        removed = 0
+        while pending and self.revalidating:
+            # Rows on screen go first, the rest in list order
+            item_id = next((i for i in self.visible_items if i in pending), None)
+            if item_id is None:
+                item_id = next(iter(pending))
+            values = pending.pop(item_id)
+
+            new_values = self.revalidate_project(values)
+            if new_values is None:
+                removed += 1
+            self.root.after(0, lambda i=item_id, v=new_values: self.apply_revalidation(i, v))
+
+        if self.revalidating:
+            self.revalidating = False
+            self.update_status(f"Revalidated {total} projects from last scan ({removed} no longer exist).")
+
+    def revalidate_project(self, values):
+        """Return refreshed row values, or None if the project folder is gone"""
+        name, path, p_type, git, status, created, modified = values
+        if not os.path.isdir(path):
+            return None
+        created, modified = self.scanner.get_directory_dates(path)
+        if os.path.exists(os.path.join(path, ".git")):
+            git, status = "Yes", self.scanner.check_git_status(path)
+            self.scanner.index_repository(path)
+        else:
+            git, status = "No", ""
+        return (name, path, p_type, git, status, created, modified)
+
+    def apply_revalidation(self, item_id, values):
+        """Main thread: update or remove a revalidated row"""
+        if not self.tree.exists(item_id):
+            return  # List was cleared by a new scan
+        if values is None:
+            self.tree.delete(item_id)
+        else:
+            tags = self.project_tags(values)
+            self.tree.item(item_id, values=values, tags=tags)
+            if "clone" in tags and self.hide_clones_var.get() and item_id not in self.hidden_clones:
+                self.hide_row(item_id)
+
+    def toggle_hide_clones(self):
+        """Collapse duplicate clones: only the first found clone of each repository stays visible"""
+        if self.hide_clones_var.get():
+            clones = [i for i in self.tree.tag_has("clone") if i not in self.hidden_clones]
+            # Bottom-up, so every recorded index is still valid when the rows are restored top-down
+            for item_id in sorted(clones, key=self.tree.index, reverse=True):
+                self.hide_row(item_id)
+        else:
+            for item_id, index in sorted(self.hidden_clones.items(), key=lambda entry: entry[1]):
+                if self.tree.exists(item_id):
+                    self.tree.move(item_id, "", index)
+            self.hidden_clones = {}
+
+    def hide_row(self, item_id):
+        self.hidden_clones[item_id] = self.tree.index(item_id)
+        self.tree.detach(item_id)
+
+    def all_items(self):
+        """All rows in list order, including hidden duplicate clones"""
+        items = list(self.tree.get_children(""))
+        for item_id, index in sorted(self.hidden_clones.items(), key=lambda entry: entry[1]):
+            if self.tree.exists(item_id):
+                items.insert(index, item_id)
+        return items
+
+    def show_duplicate_clones(self):
+        """Report repositories cloned more than once and the space the extra clones take"""
+        groups = self.scanner.duplicate_groups()
+        if not groups:
+            messagebox.showinfo("Info", "No duplicate clones found. Clones are detected during a scan.")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("Duplicate Clones")
+        window.geometry("1000x500")
+
+        summary_label = ttk.Label(window, text="Calculating sizes...", padding="10")
+        summary_label.pack(fill=tk.X)
+
+        tree = ttk.Treeview(window, columns=("clones", "size"), show="tree headings")
+        tree.heading("#0", text="Repository / Clone Path")
+        tree.heading("clones", text="Clones")
+        tree.heading("size", text="Size")
+        tree.column("#0", width=700)
+        tree.column("clones", width=80)
+        tree.column("size", width=150)
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        rows = []
+        for identity, paths in groups:
+            group_id = tree.insert("", tk.END, text=identity, values=(len(paths), ""), open=True)
+            rows.append((group_id, [(tree.insert(group_id, tk.END, text=path, values=("", "...")), path)
+                                    for path in paths]))
+
+        def calculate_sizes():
+            total_redundant = 0
+            for group_id, clones in rows:
+                sizes = []
+                for item_id, path in clones:
+                    size = folder_size(path)
+                    sizes.append(size)
+                    window.after(0, lambda i=item_id, s=size: tree.exists(i) and tree.set(i, "size", format_size(s)))
+                redundant = sum(sizes) - max(sizes)
+                total_redundant += redundant
+                window.after(0, lambda g=group_id, r=redundant: tree.exists(g) and tree.set(g, "size", f"{format_size(r)} redundant"))
+            redundant_clones = sum(len(clones) - 1 for _, clones in rows)
+            text = f"{len(rows)} repositories cloned more than once: {redundant_clones} redundant clones using {format_size(total_redundant)}"
+            window.after(0, lambda: summary_label.winfo_exists() and summary_label.config(text=text))
+
+        threading.Thread(target=calculate_sizes, daemon=True).start()
+
     def sort_by_column(self, col):
         """Sort treeview by column when header is clicked"""
-        items = [(self.tree.set(item, col), item) for item in self.tree.get_children("")]
+        items = [(self.tree.set(item, col), item) for item in self.all_items()]
         
         # Toggle sort direction
         reverse = self.sort_reverse.get(col, False)
@@ -724,9 +2592,14 @@ class ProjectScoutApp:
             # Normal string sorting
             items.sort(key=lambda x: x[0].lower() if x[0] else "", reverse=reverse)
         
-        # Rearrange items in treeview
+        # Rearrange items in treeview, hidden clones keep their sorted index for when they are shown
+        visible_index = 0
         for index, (val, item) in enumerate(items):
-            self.tree.move(item, "", index)
+            if item in self.hidden_clones:
+                self.hidden_clones[item] = index
+            else:
+                self.tree.move(item, "", visible_index)
+                visible_index += 1
         
         # Update column heading to show sort direction
         if reverse:
@@ -772,6 +2645,7 @@ class ProjectScoutApp:
              return
 
         try:
+            import subprocess
             # Use Popen to launch and not block
             # Only support Windows per user OS
             subprocess.Popen(f'antigravity "{project_path}"', shell=True)
@@ -780,12 +2654,13 @@ class ProjectScoutApp:
 
     def export_to_csv(self):
         """Export all projects from treeview to CSV file"""
-        items = self.tree.get_children()
+        items = self.all_items()  # Hidden duplicate clones are exported too
         if not items:
             messagebox.showwarning("Warning", "No projects to export. Please run a scan first.")
             return
         
         # Ask user for file location
+        from tkinter import filedialog
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
@@ -796,6 +2671,7 @@ class ProjectScoutApp:
             return  # User cancelled
         
         try:
+            import csv
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
                 # Write header
@@ -810,6 +2686,63 @@ class ProjectScoutApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export CSV file:\n{str(e)}")
 
+    def show_scan_diff(self):
+        """Show what changed between two saved scan snapshots"""
+        snapshots = list_snapshots()
+        if len(snapshots) < 2:
+            messagebox.showinfo("Info", "At least two completed scans are needed to compare results.")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("Compare Scans")
+        window.geometry("1000x500")
+
+        labels = [snapshot_label(f) for f in snapshots]
+        select_frame = ttk.Frame(window, padding="10")
+        select_frame.pack(fill=tk.X)
+        ttk.Label(select_frame, text="From:").pack(side=tk.LEFT, padx=5)
+        old_box = ttk.Combobox(select_frame, values=labels, state="readonly", width=20)
+        old_box.pack(side=tk.LEFT, padx=5)
+        ttk.Label(select_frame, text="To:").pack(side=tk.LEFT, padx=5)
+        new_box = ttk.Combobox(select_frame, values=labels, state="readonly", width=20)
+        new_box.pack(side=tk.LEFT, padx=5)
+        summary_label = ttk.Label(select_frame, text="")
+        summary_label.pack(side=tk.LEFT, padx=10)
+
+        columns = ("change", "name", "detail", "path")
+        tree = ttk.Treeview(window, columns=columns, show="headings")
+        tree.heading("change", text="Change")
+        tree.heading("name", text="Project Name")
+        tree.heading("detail", text="Details")
+        tree.heading("path", text="Directory Path")
+        tree.column("change", width=100)
+        tree.column("name", width=150)
+        tree.column("detail", width=250)
+        tree.column("path", width=450)
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        def refresh(event=None):
+            for i in tree.get_children():
+                tree.delete(i)
+            try:
+                old = load_snapshot(snapshots[old_box.current()])
+                new = load_snapshot(snapshots[new_box.current()])
+                diff = diff_snapshots(old, new)
+            except (OSError, ValueError) as e:
+                summary_label.config(text=f"Could not load snapshot: {e}")
+                return
+            for kind, entries in diff.items():
+                for before, after in entries:
+                    label, row, detail = describe_change(kind, before, after)
+                    tree.insert("", tk.END, values=(label, row[0], detail, row[1]))
+            summary_label.config(text=", ".join(f"{len(e)} {k}" for k, e in diff.items()))
+
+        old_box.bind("<<ComboboxSelected>>", refresh)
+        new_box.bind("<<ComboboxSelected>>", refresh)
+        old_box.current(len(snapshots) - 2)
+        new_box.current(len(snapshots) - 1)
+        refresh()
+
     def run_project(self):
         selected_item = self.tree.selection()
         if not selected_item:
@@ -833,6 +2766,7 @@ class ProjectScoutApp:
             command = "cmd /k" if os.name == 'nt' else "bash"
 
         try:
+            import subprocess
             # Open in new terminal window
             if os.name == 'nt':
                 # cmd /k keeps the window open after command execution
@@ -860,22 +2794,17 @@ class ProjectScoutApp:
 
         files_lower = [f.lower() for f in files]
 
+        # The manifest cache re-parses only files whose mtime/size changed since the scan
+        manifest_names = [f for f in files if f.lower() in MANIFEST_FILES or f.lower().endswith(".csproj")]
+        metadata = self.scanner.extract_project_metadata(path, manifest_names)
+
         # 1. Node.js / Web Frameworks
         if project_type in ["Node.js", "React", "Vue.js", "Next.js", "Angular", "Svelte", "Vite"]:
-            if "package.json" in files_lower:
-                try:
-                    import json
-                    files_real_names = {f.lower(): f for f in files}
-                    with open(os.path.join(path, files_real_names["package.json"]), 'r', errors='ignore') as f:
-                        pkg = json.load(f)
-                        scripts = pkg.get("scripts", {})
-                        
-                        # Preferred scripts in order
-                        for script in ["dev", "start", "serve", "watch"]:
-                            if script in scripts:
-                                return f"npm run {script}"
-                except:
-                    pass
+            scripts = metadata["manifests"].get("package.json", {}).get("scripts", {})
+            # Preferred scripts in order
+            for script in ["dev", "start", "serve", "watch"]:
+                if script in scripts:
+                    return f"npm run {script}"
             return "npm start" # Fallback
 
         # 2. .NET / C#
@@ -921,7 +2850,59 @@ class ProjectScoutApp:
 
         return None
 
-if __name__ == "__main__":
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Project Scout - Find Your Projects")
+    parser.add_argument("--diff", nargs="*", metavar="SNAPSHOT",
+                        help="print changes between two saved scans (file, name or index, default: last two)")
+    parser.add_argument("--duplicates", action="store_true",
+                        help="report repositories cloned more than once in the last scan")
+    parser.add_argument("--daemon", action="store_true",
+                        help="run headless, keep the project index warm and answer queries")
+    parser.add_argument("--refresh-minutes", type=int, default=DAEMON_REFRESH_MINUTES,
+                        help="how often the daemon rescans (default: %(default)s)")
+    parser.add_argument("--follow-links", action="store_true",
+                        help="with --daemon: follow symlinks and junctions (each folder is still scanned once)")
+    parser.add_argument("--full-scan", action="store_true",
+                        help="with --daemon: don't skip folders that never contained projects")
+    parser.add_argument("--query", nargs="?", const="", metavar="TEXT",
+                        help="query a running daemon, TEXT is fuzzy matched against project names")
+    parser.add_argument("--type", default="", help="with --query: filter by project type")
+    parser.add_argument("--status", default="", help="with --query: git status (Clean, Dirty, ...), 'git' or 'nogit'")
+    parser.add_argument("--recent", type=int, metavar="DAYS", help="with --query: modified within DAYS days")
+    parser.add_argument("--limit", type=int, default=50, help="with --query: maximum results (default: %(default)s)")
+    parser.add_argument("--paths", action="store_true", help="with --query: print only paths")
+    parser.add_argument("--json", action="store_true", help="with --query: print results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.diff is not None:
+        return print_snapshot_diff(args.diff)
+    if args.duplicates:
+        return print_duplicate_report()
+    if args.daemon:
+        try:
+            IndexDaemon(refresh_minutes=args.refresh_minutes, follow_links=args.follow_links,
+                        full_scan=args.full_scan).serve_forever()
+        except (OSError, RuntimeError) as e:
+            print(f"Error: {e}")
+            return 1
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if args.query is not None:
+        return print_query_results(args)
+
+    global tk, ttk, messagebox
+    try:
+        import tkinter as tk
+        from tkinter import ttk, messagebox
+    except ImportError:
+        print("Error: tkinter is not installed, the GUI is unavailable (--daemon, --query, --diff and --duplicates work without it)")
+        return 1
     root = tk.Tk()
     app = ProjectScoutApp(root)
     root.mainloop()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())